@@ -0,0 +1,51 @@
+# Times enemy steering through the per-archetype kernels
+# (EnemyBehavior.update_all) from small waves up to large swarms.
+#
+#   python benchmarks/bench_enemies.py [--repeat 200]
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bullet import BulletStore
+from enemy import Enemy
+from mechanics import EnemyBehavior
+from player import Player
+from random_streams import RandomStreams
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+ENEMY_COUNTS = (4, 16, 50, 200, 1000)
+ENEMY_TYPES = ("normal", "fast", "tough", "flanker", "zigzag")
+
+def time_per_tick(step, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        step()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Enemy steering benchmark")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, SCREEN_WIDTH, SCREEN_HEIGHT)
+    print(f"{'enemies':>8} {'ms/tick':>10} {'us/enemy':>10}")
+    for count in ENEMY_COUNTS:
+        enemies = [Enemy(rng.choice(ENEMY_TYPES), SCREEN_WIDTH, SCREEN_HEIGHT, rng) for _ in range(count)]
+        behavior = EnemyBehavior(RandomStreams(0))
+        # Bullets are dropped every tick so the store never grows over the run
+        bullets = BulletStore(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        def batched():
+            behavior.update_all(enemies, player, bullets, 0)
+            bullets.clear()
+
+        batched_ms = time_per_tick(batched, args.repeat)
+        print(f"{count:>8} {batched_ms:>10.3f} {batched_ms * 1000 / count:>10.2f}")
+
+if __name__ == "__main__":
+    main()
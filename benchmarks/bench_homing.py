@@ -0,0 +1,67 @@
+# Compares homing target acquisition: the old per-bullet linear scan against
+# one batched nearest-neighbour query on the enemy grid.
+#
+#   python benchmarks/bench_homing.py [--bullets 60] [--repeat 200]
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from enemy import Enemy
+from spatial_hash import SpatialHash
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+ENEMY_COUNTS = (50, 200, 1000)
+
+def linear_scan(bullet_xy, enemies):
+    targets = []
+    for bx, by in bullet_xy:
+        targets.append(min(enemies, key=lambda e: math.hypot(e.x - bx, e.y - by)))
+    return targets
+
+def grid_query(grid, bullet_xy, enemies):
+    grid.rebuild([e.x for e in enemies], [e.y for e in enemies], [e.size for e in enemies])
+    xs = np.array([x for x, _ in bullet_xy])
+    ys = np.array([y for _, y in bullet_xy])
+    return [enemies[i] for i in grid.nearest(xs, ys).tolist()]
+
+def time_per_call(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Homing target acquisition benchmark")
+    parser.add_argument("--bullets", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(0)
+    grid = SpatialHash.for_arena(SCREEN_WIDTH, SCREEN_HEIGHT, largest_size=30)
+    print(f"{args.bullets} homing bullets, ms per tick")
+    print(f"{'enemies':>8} {'linear':>10} {'grid':>10} {'speedup':>8}")
+    for count in ENEMY_COUNTS:
+        enemies = [Enemy(random.choice(["normal", "fast", "boss"]), SCREEN_WIDTH, SCREEN_HEIGHT) for _ in range(count)]
+        for enemy in enemies:
+            enemy.x = random.uniform(0, SCREEN_WIDTH)
+            enemy.y = random.uniform(0, SCREEN_HEIGHT)
+        bullet_xy = [(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT)) for _ in range(args.bullets)]
+
+        expected = linear_scan(bullet_xy, enemies)
+        found = grid_query(grid, bullet_xy, enemies)
+        for (bx, by), a, b in zip(bullet_xy, expected, found):
+            assert math.isclose(math.hypot(a.x - bx, a.y - by), math.hypot(b.x - bx, b.y - by))
+
+        linear_ms = time_per_call(lambda: linear_scan(bullet_xy, enemies), args.repeat)
+        grid_ms = time_per_call(lambda: grid_query(grid, bullet_xy, enemies), args.repeat)
+        print(f"{count:>8} {linear_ms:>10.3f} {grid_ms:>10.3f} {linear_ms / grid_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Bytes per entity for the dict-backed object layout enemies and power-ups
+# used to have against their current __slots__ classes, and bytes per row of
+# the array stores bullets and particles live in.
+#
+#   python benchmarks/bench_memory.py [--count 10000]
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bullet import BulletStore
+from enemy import Enemy
+from particle import ParticleSystem
+from powerup import PowerUp
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+
+def with_dict(cls):
+    # A plain class with the same attributes set in the same order, which is
+    # what the entity classes were before they gained __slots__
+    plain = type("Plain" + cls.__name__, (), {})
+    def build(*args):
+        source = cls(*args)
+        entity = plain()
+        for name in cls.__slots__:
+            setattr(entity, name, getattr(source, name))
+        return entity
+    return build
+
+def bytes_per_object(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build() for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return used / count
+
+def bytes_per_row(store):
+    return sum(column.itemsize for column in store)
+
+def main():
+    parser = argparse.ArgumentParser(description="Entity memory footprint benchmark")
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    entities = {
+        "enemy": (Enemy, lambda: ("normal", SCREEN_WIDTH, SCREEN_HEIGHT, rng)),
+        "powerup": (PowerUp, lambda: (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), "spread")),
+    }
+    stores = {
+        "bullet": BulletStore(SCREEN_WIDTH, SCREEN_HEIGHT).columns(),
+        "particle": [column for column in vars(ParticleSystem(1)).values() if hasattr(column, "itemsize")],
+    }
+
+    print(f"bytes per entity, {args.count} live")
+    print(f"{'entity':>9} {'dict':>8} {'slots':>8}")
+    for name, (cls, make_args) in entities.items():
+        plain = with_dict(cls)
+        dict_bytes = bytes_per_object(lambda: plain(*make_args()), args.count)
+        slots_bytes = bytes_per_object(lambda: cls(*make_args()), args.count)
+        print(f"{name:>9} {dict_bytes:>8.0f} {slots_bytes:>8.0f}")
+    print(f"{'store':>9} {'row':>8}")
+    for name, columns in stores.items():
+        print(f"{name:>9} {bytes_per_row(columns):>8}")
+
+if __name__ == "__main__":
+    main()
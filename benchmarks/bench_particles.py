@@ -0,0 +1,83 @@
+# Compares a list of particle objects, how particles were stored before
+# ParticleSystem, against the ParticleSystem ring when a burst of kills lands
+# in a single tick: the cost of that tick, then the
+# mean tick cost while the burst fades out.
+#
+#   python benchmarks/bench_particles.py [--ticks 60] [--repeat 20]
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from particle import ParticleSystem
+
+KILL_COUNTS = (10, 50, 200)
+PARTICLES_PER_KILL = 20
+
+class Particle:
+    # One object per particle, updated one at a time
+    def __init__(self, x, y, angle, speed, lifetime):
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.speed = speed
+        self.lifetime = lifetime
+
+    def update(self):
+        self.x += self.speed * math.cos(self.angle)
+        self.y += self.speed * math.sin(self.angle)
+        self.lifetime -= 1
+
+def run_objects(kills, ticks, rng):
+    particles = []
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(kills):
+        x, y = rng.uniform(0, 1920), rng.uniform(0, 1080)
+        for _ in range(PARTICLES_PER_KILL):
+            particles.append(Particle(x, y, rng.uniform(0, 2 * math.pi), rng.uniform(1, 3), rng.randint(30, 60)))
+    burst = clock() - start
+    start = clock()
+    for _ in range(ticks):
+        for particle in particles[:]:
+            particle.update()
+            if particle.lifetime <= 0:
+                particles.remove(particle)
+    return burst, (clock() - start) / ticks
+
+def run_ring(kills, ticks, rng, generator):
+    particles = ParticleSystem()
+    clock = time.perf_counter
+    start = clock()
+    xs = [rng.uniform(0, 1920) for _ in range(kills)]
+    ys = [rng.uniform(0, 1080) for _ in range(kills)]
+    particles.emit(xs, ys, generator, PARTICLES_PER_KILL)
+    burst = clock() - start
+    start = clock()
+    for _ in range(ticks):
+        particles.update()
+    return burst, (clock() - start) / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description="Particle burst benchmark")
+    parser.add_argument("--ticks", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"ms, best of {args.repeat}")
+    print(f"{'kills':>6} {'objects burst':>14} {'ring burst':>11} {'objects tick':>13} {'ring tick':>10}")
+    for kills in KILL_COUNTS:
+        objects = min(run_objects(kills, args.ticks, random.Random(seed)) for seed in range(args.repeat))
+        ring = min(run_ring(kills, args.ticks, random.Random(seed), np.random.default_rng(seed))
+                   for seed in range(args.repeat))
+        print(f"{kills:>6} {objects[0] * 1000:>14.3f} {ring[0] * 1000:>11.3f} "
+              f"{objects[1] * 1000:>13.3f} {ring[1] * 1000:>10.3f}")
+
+if __name__ == "__main__":
+    main()
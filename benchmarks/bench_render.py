@@ -0,0 +1,100 @@
+# Compares the per-object entity draw path against the batched sprite
+# renderer on an offscreen surface.
+#
+#   python benchmarks/bench_render.py [--entities 5000] [--frames 60]
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+import pygame
+
+from bullet import BulletStore
+from colors import Colors
+from effects import EffectCache
+from enemy import Enemy
+from particle import ParticleSystem
+from powerup import PowerUp
+from renderer import SpriteBatchRenderer
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+
+def build_scene(total):
+    rng = random.Random(0)
+    def point():
+        return rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+
+    bullets = BulletStore(SCREEN_WIDTH, SCREEN_HEIGHT, friendly=True)
+    enemy_bullets = BulletStore(SCREEN_WIDTH, SCREEN_HEIGHT)
+    for _ in range(total * 20 // 100):
+        x, y = point()
+        bullet_type = rng.choice(["default", "default", "laser", "homing"])
+        bullets.spawn(x, y, rng.uniform(0, 2 * math.pi), speed=20 if bullet_type == "laser" else 10,
+                      bullet_type=bullet_type, glow=rng.random() < 0.3)
+    for _ in range(total * 50 // 100):
+        enemy_bullets.spawn(*point(), rng.uniform(0, 2 * math.pi))
+    enemies = []
+    for _ in range(total * 10 // 100):
+        enemy = Enemy(rng.choice(["normal", "fast", "boss"]), SCREEN_WIDTH, SCREEN_HEIGHT)
+        enemy.x, enemy.y = point()
+        enemies.append(enemy)
+    powerups = [PowerUp(*point(), rng.choice(list(Colors.POWERUP_COLORS))) for _ in range(total * 2 // 100)]
+    particles = ParticleSystem(capacity=max(1, total * 18 // 100))
+    scatter = np.random.default_rng(0)
+    for _ in range(total * 18 // 100):
+        particles.emit(*point(), scatter, n=1, speed=(0, 0))
+    return bullets, enemy_bullets, enemies, powerups, particles
+
+def draw_per_object(screen, effects, scene):
+    bullets, enemy_bullets, enemies, powerups, particles = scene
+    bullets.draw(screen, effects)
+    enemy_bullets.draw(screen, effects)
+    for enemy in enemies:
+        enemy.draw(screen, Colors.BOSS_COLOR, Colors.ENEMY_COLOR)
+    for powerup in powerups:
+        powerup.draw(screen)
+    particles.draw(screen)
+
+def draw_batched(screen, renderer, scene):
+    bullets, enemy_bullets, enemies, powerups, particles = scene
+    renderer.draw_bullets(screen, bullets)
+    renderer.draw_bullets(screen, enemy_bullets)
+    renderer.draw_enemies(screen, enemies)
+    renderer.draw_powerups(screen, powerups)
+    renderer.draw_particles(screen, particles)
+
+def time_frames(draw, screen, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill(Colors.BACKGROUND_COLOR)
+        draw()
+    return (time.perf_counter() - start) / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Entity render path benchmark")
+    parser.add_argument("--entities", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    effects = EffectCache()
+    renderer = SpriteBatchRenderer(effects)
+    scene = build_scene(args.entities)
+
+    draw_batched(screen, renderer, scene)  # Warm the sprite caches
+    per_object_ms = time_frames(lambda: draw_per_object(screen, effects, scene), screen, args.frames)
+    batched_ms = time_frames(lambda: draw_batched(screen, renderer, scene), screen, args.frames)
+    print(f"{args.entities} entities, ms per frame")
+    print(f"  per-object {per_object_ms:8.3f}")
+    print(f"  batched    {batched_ms:8.3f}  ({per_object_ms / batched_ms:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Runs the named, seeded benchmark scenarios and compares them against the
+# committed baseline. Simulation ticks and offscreen draw frames are timed
+# separately.
+#
+#   python benchmarks/run_benchmarks.py                      # all scenarios
+#   python benchmarks/run_benchmarks.py -s wave_30 -s boss_spiral
+#   python benchmarks/run_benchmarks.py --update-baseline    # record a new baseline
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "src"))
+sys.path.insert(0, BENCH_DIR)
+
+from headless import create_game
+from scenarios import SCENARIOS
+
+import pygame
+
+SCREEN_SIZE = (1920, 1080)
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+METRICS = ("update_ticks_per_second", "draw_frames_per_second")
+
+def run_scenario(scenario, seed, draw_every):
+    random.seed(seed)
+    source = scenario.make_input(seed)
+    game = create_game(source, SCREEN_SIZE, screen=pygame.Surface(SCREEN_SIZE), render_mode="offscreen", seed=seed)
+    scenario.setup(game)
+
+    update_ns = 0
+    draw_ns = 0
+    frames = 0
+    peak_entities = 0
+    clock = time.perf_counter_ns
+    for tick in range(scenario.ticks):
+        if scenario.on_tick is not None:
+            scenario.on_tick(game, tick)
+        game.handle_input()  # Input-source cost is not simulation cost
+        start = clock()
+        game.update_game_state()
+        update_ns += clock() - start
+        source.advance()
+
+        if tick % draw_every == 0:
+            start = clock()
+            game.draw_game()
+            draw_ns += clock() - start
+            frames += 1
+        entities = len(game.bullets) + len(game.enemy_bullets) + len(game.enemies) + len(game.particles)
+        peak_entities = max(peak_entities, entities)
+
+    return {
+        "ticks": scenario.ticks,
+        "frames": frames,
+        "update_ticks_per_second": scenario.ticks / (update_ns / 1e9),
+        "draw_frames_per_second": frames / (draw_ns / 1e9) if draw_ns else 0.0,
+        "peak_entities": peak_entities,
+    }
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            print(f"  {name}: no baseline")
+            continue
+        for metric in METRICS:
+            change = result[metric] / reference[metric] - 1
+            flag = "REGRESSION" if change < -threshold else ""
+            print(f"  {name:<22} {metric:<25} {reference[metric]:>10.1f} -> {result[metric]:>10.1f} "
+                  f"({change:+.1%}) {flag}")
+            if flag:
+                regressions.append((name, metric))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scenario benchmarks for simulation and rendering")
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run, may be repeated (default: all)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--draw-every", type=int, default=1, help="draw one frame every N ticks")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="fractional slowdown that counts as a regression")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with these results")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    results = {}
+    for name in names:
+        scenario = SCENARIOS[name]
+        results[name] = result = run_scenario(scenario, args.seed, args.draw_every)
+        print(f"{name:<22} {result['update_ticks_per_second']:>9.0f} ticks/s  "
+              f"{result['draw_frames_per_second']:>7.0f} frames/s  peak entities {result['peak_entities']}")
+
+    report = {
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    print(f"Against {os.path.relpath(args.baseline)} (threshold {args.threshold:.0%}):")
+    regressions = compare(results, baseline, args.threshold)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
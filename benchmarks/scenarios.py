@@ -0,0 +1,89 @@
+import math
+import random
+
+from input_source import RandomInput, ScriptedInput, IdleInput
+
+IMMORTAL = 10 ** 9  # Player health so a scenario never ends early
+
+class Scenario:
+    def __init__(self, name, description, ticks, make_input, setup, on_tick=None):
+        self.name = name
+        self.description = description
+        self.ticks = ticks
+        self.make_input = make_input
+        self.setup = setup
+        self.on_tick = on_tick
+
+def immortal(game):
+    game.player.hits_remaining = IMMORTAL
+
+def clear_enemies(game):
+    # Through the game, so the pool gets them back and nothing still points at them
+    game.release_enemies(game.enemies)
+    game.enemies.clear()
+
+def add_enemy(game, enemy_type):
+    enemy = game.enemy_pool.acquire(enemy_type, game.screen_width, game.screen_height, game.rng.spawn)
+    game.enemies.append(enemy)
+    return enemy
+
+def early_wave(game):
+    immortal(game)
+
+def wave_30(game):
+    immortal(game)
+    clear_enemies(game)
+    game.wave = 30
+    game.spawn_enemies()
+
+def boss_spiral(game):
+    immortal(game)
+    clear_enemies(game)
+    for _ in range(3):
+        add_enemy(game, "boss")
+    game.enemy_behavior.difficulty_multiplier = 2.0
+    game.score = 10000  # Keeps update_difficulty at the cap
+
+def homing_swarm(game):
+    immortal(game)
+    clear_enemies(game)
+    for _ in range(500):
+        enemy = add_enemy(game, "normal")
+        enemy.health = IMMORTAL  # The swarm has to survive the whole run
+    game.player.fire_rate = 1
+
+def alternate_weapons(game, tick):
+    # Swap homing and multishot every second
+    game.player.current_weapon = "homing" if (tick // 60) % 2 == 0 else "multishot"
+    game.player.powerup_timer = 600
+
+def graze_dodge(game):
+    immortal(game)
+    clear_enemies(game)
+    add_enemy(game, "tough").health = IMMORTAL
+
+def converging_rings(game, tick):
+    # A ring of bullets every few ticks, aimed to pass just beside the player
+    if tick % 4:
+        return
+    player = game.player
+    count = 48
+    radius = 400
+    offset = random.uniform(0, 2 * math.pi)
+    for i in range(count):
+        angle = offset + i * 2 * math.pi / count
+        x = player.x + math.cos(angle) * radius
+        y = player.y + math.sin(angle) * radius
+        heading = angle + math.pi + random.uniform(-0.12, 0.12)
+        game.enemy_bullets.spawn(x, y, heading, speed=4)
+
+SCENARIOS = {scenario.name: scenario for scenario in [
+    Scenario("early_wave", "Wave 1 under random play", 1200, lambda seed: RandomInput(seed), early_wave),
+    Scenario("wave_30", "Wave 30 spawned at full size", 900, lambda seed: RandomInput(seed), wave_30),
+    Scenario("boss_spiral", "Three bosses at max difficulty filling the arena", 900,
+             lambda seed: ScriptedInput(), boss_spiral),
+    Scenario("homing_multishot_500", "Homing and multishot fire into 500 enemies", 600,
+             lambda seed: ScriptedInput(), homing_swarm, alternate_weapons),
+    Scenario("graze_dodge", "Dense converging bullet rings around a still player", 900,
+             lambda seed: IdleInput(), graze_dodge, converging_rings),
+]}
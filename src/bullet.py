@@ -1,64 +1,188 @@
 import pygame
 import math
+import numpy as np
 from colors import Colors
 
-class Bullet:
-    def __init__(self, x, y, angle, friendly=False, speed=10, damage=1, bullet_type="default"):
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.speed = speed
-        self.size = 3
+BULLET_TYPES = ("default", "laser", "homing", "piercing")
+BULLET_TYPE_CODES = {name: code for code, name in enumerate(BULLET_TYPES)}
+
+class BulletStore:
+    # Structure-of-arrays bullet storage. Row i of every column describes one
+    # live bullet; rows [0, count) are live and dead rows are filled from the
+    # tail so the live block always stays contiguous.
+    def __init__(self, screen_width, screen_height, friendly=False, capacity=1024):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
         self.friendly = friendly
-        self.damage = damage
-        self.bullet_type = bullet_type
-        self.lifetime = 180  # 3 seconds at 60 FPS
-        self.target = None  # For homing bullets
-        self.glow_timer = 0  # Timer for glowing effect
-
-    def update(self, target=None):
-        if self.bullet_type == "homing" and target:
-            self.home_in_on_target(target)
-        else:
-            self.x += self.speed * math.cos(self.angle)
-            self.y += self.speed * math.sin(self.angle)
-        self.lifetime -= 1
-
-        # Update glow timer
-        if self.glow_timer > 0:
-            self.glow_timer -= 1
-
-    def home_in_on_target(self, target):
-        if target:
-            dx = target.x - self.x
-            dy = target.y - self.y
-            self.angle = math.atan2(dy, dx)
-        self.x += self.speed * math.cos(self.angle)
-        self.y += self.speed * math.sin(self.angle)
-
-    def draw(self, screen):
+        self.size = 3
+        self.count = 0
+        self.capacity = 0
+        self.high_water = 0  # Most rows ever live at once
+        self.x = self.y = self.vx = self.vy = None
+        self.prev_x = self.prev_y = None  # Positions at the start of the last update, for interpolation
+        self.angle = self.speed = self.damage = None
+        self.lifetime = self.glow_timer = self.type = None
+        self.target = None  # Sticky homing target per row, None until acquired
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        def resized(column, dtype):
+            new_column = np.zeros(capacity, dtype=dtype)
+            if column is not None:
+                new_column[:self.count] = column[:self.count]
+            return new_column
+
+        self.x = resized(self.x, np.float64)
+        self.y = resized(self.y, np.float64)
+        self.prev_x = resized(self.prev_x, np.float64)
+        self.prev_y = resized(self.prev_y, np.float64)
+        self.vx = resized(self.vx, np.float64)
+        self.vy = resized(self.vy, np.float64)
+        self.angle = resized(self.angle, np.float64)
+        self.speed = resized(self.speed, np.float64)
+        self.damage = resized(self.damage, np.int32)
+        self.lifetime = resized(self.lifetime, np.int32)
+        self.glow_timer = resized(self.glow_timer, np.int32)
+        self.type = resized(self.type, np.int8)
+        target = np.full(capacity, None, dtype=object)
+        if self.target is not None:
+            target[:self.count] = self.target[:self.count]
+        self.target = target
+        self.capacity = capacity
+
+    def _reserve(self, n):
+        if self.count + n > self.capacity:
+            capacity = self.capacity
+            while self.count + n > capacity:
+                capacity *= 2
+            self._grow(capacity)
+        start = self.count
+        self.count += n
+        self.high_water = max(self.high_water, self.count)
+        return start
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, angle, speed=10, damage=1, bullet_type="default", glow=False):
+        i = self._reserve(1)
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.angle[i] = angle
+        self.speed[i] = speed
+        self.vx[i] = speed * math.cos(angle)
+        self.vy[i] = speed * math.sin(angle)
+        self.damage[i] = damage
+        self.lifetime[i] = 180  # 3 seconds at 60 FPS
+        self.glow_timer[i] = 30 if glow else 0
+        self.type[i] = BULLET_TYPE_CODES[bullet_type]
+        self.target[i] = None
+        return i
+
+    def spawn_many(self, x, y, angles, speed=10, damage=1, bullet_type="default", glow=False):
+        angles = np.asarray(angles, dtype=np.float64)
+        n = len(angles)
+        start = self._reserve(n)
+        rows = slice(start, start + n)
+        self.x[rows] = self.prev_x[rows] = x
+        self.y[rows] = self.prev_y[rows] = y
+        self.angle[rows] = angles
+        self.speed[rows] = speed
+        self.vx[rows] = speed * np.cos(angles)
+        self.vy[rows] = speed * np.sin(angles)
+        self.damage[rows] = damage
+        self.lifetime[rows] = 180
+        self.glow_timer[rows] = 30 if glow else 0
+        self.type[rows] = BULLET_TYPE_CODES[bullet_type]
+        self.target[rows] = None
+        return rows
+
+    def steer(self, rows, target_x, target_y):
+        angles = np.arctan2(target_y - self.y[rows], target_x - self.x[rows])
+        self.angle[rows] = angles
+        self.vx[rows] = self.speed[rows] * np.cos(angles)
+        self.vy[rows] = self.speed[rows] * np.sin(angles)
+
+    def rows_of_type(self, bullet_type):
+        return np.flatnonzero(self.type[:self.count] == BULLET_TYPE_CODES[bullet_type])
+
+    def update(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.lifetime[:n] -= 1
+        glow = self.glow_timer[:n]
+        glow -= glow > 0
+        self.compact()
+
+    def kill(self, rows):
+        self.lifetime[rows] = 0
+
+    def compact(self):
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        keep = ((self.lifetime[:n] > 0) & (x >= 0) & (x < self.screen_width)
+                & (y >= 0) & (y < self.screen_height))
+        new_count = int(np.count_nonzero(keep))
+        if new_count == n:
+            return
+        # Swap-compaction: move the live rows from the tail into the holes
+        # left in the head, touching only as many rows as were removed.
+        holes = np.flatnonzero(~keep[:new_count])
+        tail = np.flatnonzero(keep[new_count:]) + new_count
+        if len(holes):
+            for column in self.columns():
+                column[holes] = column[tail]
+        self.target[new_count:n] = None  # Drop references held by dead rows
+        self.count = new_count
+
+    def copy_from(self, other):
+        # The live rows of the columns drawing reads, for a render snapshot
+        n = other.count
+        if n > self.capacity:
+            self.count = 0
+            self._grow(other.capacity)
+        for mine, theirs in zip(self.draw_columns(), other.draw_columns()):
+            mine[:n] = theirs[:n]
+        self.count = n
+
+    def draw_columns(self):
+        return (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy, self.speed, self.glow_timer, self.type)
+
+    def columns(self):
+        return (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy, self.angle, self.speed,
+                self.damage, self.lifetime, self.glow_timer, self.type, self.target)
+
+    def clear(self):
+        self.target[:self.count] = None
+        self.count = 0
+
+    def positions(self, alpha=1.0):
+        # Live positions blended between the last two updates; alpha 1 is the current state
+        n = self.count
+        if alpha >= 1.0:
+            return self.x[:n], self.y[:n]
+        return (self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha,
+                self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha)
+
+    def draw(self, screen, effects):
         color = Colors.BULLET_COLOR if self.friendly else Colors.ENEMY_COLOR
-        if self.bullet_type == "laser":
-            pygame.draw.line(screen, color, (int(self.x), int(self.y)), 
-                             (int(self.x + self.speed * 2 * math.cos(self.angle)), 
-                              int(self.y + self.speed * 2 * math.sin(self.angle))), 2)
-        else:
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
-
-        # Draw glowing effect
-        if self.glow_timer > 0:
-            glow_color = Colors.BULLET_COLOR if self.friendly else Colors.ENEMY_COLOR
-            glow_size = self.size + self.glow_timer // 5
-            glow_alpha = 128 * (self.glow_timer / 30)
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*glow_color, int(glow_alpha)), (glow_size, glow_size), glow_size)
-            screen.blit(glow_surface, (int(self.x - glow_size), int(self.y - glow_size)))
-
-    def collides_with(self, other):
-        return math.hypot(self.x - other.x, self.y - other.y) < self.size + other.size
-
-    def is_on_screen(self, screen_width, screen_height):
-        return 0 <= self.x < screen_width and 0 <= self.y < screen_height
-
-    def start_glow(self):
-        self.glow_timer = 30  # Glow for 0.5 seconds
\ No newline at end of file
+        laser = BULLET_TYPE_CODES["laser"]
+        for i in range(self.count):
+            x = self.x[i]
+            y = self.y[i]
+            if self.type[i] == laser:
+                pygame.draw.line(screen, color, (int(x), int(y)),
+                                 (int(x + self.vx[i] * 2), int(y + self.vy[i] * 2)), 2)
+            else:
+                pygame.draw.circle(screen, color, (int(x), int(y)), self.size)
+
+            glow_timer = int(self.glow_timer[i])
+            if glow_timer > 0:
+                glow, (ox, oy) = effects.glow(color, self.size + glow_timer // 5, 128 * (glow_timer / 30))
+                screen.blit(glow, (int(x + ox), int(y + oy)))
@@ -0,0 +1,116 @@
+import math
+from collections import OrderedDict
+import pygame
+
+class EffectCache:
+    # Pre-rendered translucent effect sprites (glows, graze arcs), keyed by
+    # effect kind, colour, quantized angle, size and alpha step. The draw path
+    # only blits; anything missing is rendered once and the least recently
+    # used sprites are evicted when the cache runs over its budget.
+    def __init__(self, max_entries=4096, max_bytes=16 * 1024 * 1024, alpha_steps=16, angle_steps=64):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.alpha_steps = alpha_steps
+        self.angle_steps = angle_steps
+        self.sprites = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize_alpha(self, alpha):
+        return max(0, min(self.alpha_steps - 1, round(alpha / 255 * (self.alpha_steps - 1))))
+
+    def quantize_angle(self, angle):
+        return round((angle % (2 * math.pi)) / (2 * math.pi) * self.angle_steps) % self.angle_steps
+
+    def get(self, key, render):
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        surface = sprite[0]
+        self.sprites[key] = sprite
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self.sprites and (len(self.sprites) > self.max_entries or self.bytes > self.max_bytes):
+            _, (evicted, _) = self.sprites.popitem(last=False)
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        return sprite
+
+    def glow(self, color, size, alpha):
+        # Returns (sprite, offset); blit the sprite at the glow centre + offset
+        alpha_step = self.quantize_alpha(alpha)
+        return self.get(("glow", color, size, alpha_step),
+                        lambda: self.render_glow(color, size, alpha_step))
+
+    def arc(self, color, radius, angle, alpha, spread=0.3, width=3):
+        alpha_step = self.quantize_alpha(alpha)
+        angle_step = self.quantize_angle(angle)
+        return self.get(("arc", color, radius, angle_step, alpha_step),
+                        lambda: self.render_arc(color, radius, angle_step, alpha_step, spread, width))
+
+    def ring(self, color, radius, alpha, width=3):
+        alpha_step = self.quantize_alpha(alpha)
+        return self.get(("ring", color, radius, alpha_step),
+                        lambda: self.render_ring(color, radius, alpha_step, width))
+
+    def step_alpha(self, alpha_step):
+        return int(alpha_step * 255 / (self.alpha_steps - 1))
+
+    def render_glow(self, color, size, alpha_step):
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, self.step_alpha(alpha_step)), (size, size), size)
+        return surface, (-size, -size)
+
+    def render_ring(self, color, radius, alpha_step, width):
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, self.step_alpha(alpha_step)), (radius, radius), radius, width)
+        return surface, (-radius, -radius)
+
+    def render_arc(self, color, radius, angle_step, alpha_step, spread, width):
+        angle = angle_step * (2 * math.pi / self.angle_steps)
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.arc(surface, (*color, self.step_alpha(alpha_step)),
+                        (0, 0, radius * 2, radius * 2), angle - spread, angle + spread, width)
+        # Keep only the pixels the arc touches, it is a sliver of the full circle
+        bounds = surface.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            return surface, (-radius, -radius)
+        return surface.subsurface(bounds).copy(), (bounds.x - radius, bounds.y - radius)
+
+    def prewarm_glows(self, colors, sizes):
+        for color in colors:
+            for size in sizes:
+                for alpha_step in range(self.alpha_steps):
+                    self.get(("glow", color, size, alpha_step),
+                             lambda: self.render_glow(color, size, alpha_step))
+
+    def prewarm_arcs(self, colors, radius, angles, spread=0.3, width=3):
+        for color in colors:
+            for angle in angles:
+                angle_step = self.quantize_angle(angle)
+                for alpha_step in range(self.alpha_steps):
+                    self.get(("arc", color, radius, angle_step, alpha_step),
+                             lambda: self.render_arc(color, radius, angle_step, alpha_step, spread, width))
+
+    def prewarm_rings(self, colors, radii, width=3):
+        for color, radius in zip(colors, radii):
+            for alpha_step in range(self.alpha_steps):
+                self.get(("ring", color, radius, alpha_step),
+                         lambda: self.render_ring(color, radius, alpha_step, width))
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.sprites),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
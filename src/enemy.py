@@ -3,23 +3,48 @@ import math
 import random
 
 class Enemy:
-    def __init__(self, enemy_type, screen_width, screen_height):
+    __slots__ = ("type", "size", "x", "y", "prev_x", "prev_y", "health", "score_value")
+
+    def __init__(self, enemy_type, screen_width, screen_height, rng=random, position=None):
+        self.reset(enemy_type, screen_width, screen_height, rng, position)
+
+    def reset(self, enemy_type, screen_width, screen_height, rng=random, position=None):
+        # Also called by EntityPool to bring a released enemy back as a new one;
+        # position is the spawn point when it was rolled ahead of time
         self.type = enemy_type
-        self.size = 30 if enemy_type == "boss" else 15
-        self.x, self.y = self.get_spawn_position(screen_width, screen_height)
+        self.size = self.size_for(enemy_type)
+        if position is None:
+            position = self.get_spawn_position(screen_width, screen_height, rng)
+        self.x, self.y = position
+        self.prev_x, self.prev_y = self.x, self.y
         self.health = 50 if enemy_type == "boss" else (3 if enemy_type == "tough" else 1)
         self.score_value = 100 if enemy_type == "boss" else (30 if enemy_type == "tough" else 10)
 
-    def get_spawn_position(self, screen_width, screen_height):
-        side = random.choice(['top', 'bottom', 'left', 'right'])
+    def copy_from(self, other):
+        self.type = other.type
+        self.size = other.size
+        self.x = other.x
+        self.y = other.y
+        self.prev_x = other.prev_x
+        self.prev_y = other.prev_y
+        self.health = other.health
+        self.score_value = other.score_value
+
+    @staticmethod
+    def size_for(enemy_type):
+        return 30 if enemy_type == "boss" else 15
+
+    @staticmethod
+    def get_spawn_position(screen_width, screen_height, rng=random):
+        side = rng.choice(['top', 'bottom', 'left', 'right'])
         if side == 'top':
-            return random.randint(0, screen_width), 0
+            return rng.randint(0, screen_width), 0
         elif side == 'bottom':
-            return random.randint(0, screen_width), screen_height
+            return rng.randint(0, screen_width), screen_height
         elif side == 'left':
-            return 0, random.randint(0, screen_height)
+            return 0, rng.randint(0, screen_height)
         else:
-            return screen_width, random.randint(0, screen_height)
+            return screen_width, rng.randint(0, screen_height)
 
     def take_damage(self, amount):
         self.health -= amount
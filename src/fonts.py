@@ -0,0 +1,65 @@
+import threading
+from collections import OrderedDict
+import pygame
+
+class FontRegistry:
+    # One pygame Font per (name, size), created on first use
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, size, name=None):
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = pygame.font.Font(name, size)
+        return font
+
+class TextCache:
+    # Rendered text surfaces keyed by (font, text, colour) with LRU eviction,
+    # so glyphs for strings that were already on screen are never rasterized
+    # again. Locked, because sprite prewarming renders text off the main thread.
+    def __init__(self, fonts, max_entries=512):
+        self.fonts = fonts
+        self.lock = threading.Lock()
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, size, text, color, name=None):
+        key = (name, size, text, color)
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.hits += 1
+                self.surfaces.move_to_end(key)
+                return surface
+
+            self.misses += 1
+            surface = self.surfaces[key] = self.fonts.get(size, name).render(text, True, color)
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+            return surface
+
+class HudText:
+    # A HUD label bound to a value; the text is only rebuilt when the value changes
+    def __init__(self, text_cache, size, color, template, value):
+        self.text_cache = text_cache
+        self.size = size
+        self.color = color
+        self.template = template
+        self.value = value
+        self.last_value = None
+        self.current = None
+
+    def surface(self):
+        value = self.value()
+        if self.current is None or value != self.last_value:
+            self.last_value = value
+            self.current = self.text_cache.render(self.size, self.template.format(value), self.color)
+        return self.current
+
+shared_fonts = FontRegistry()
+shared_text = TextCache(shared_fonts)
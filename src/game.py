@@ -1,151 +1,397 @@
 import pygame
-import math
-import random
+import numpy as np
+import struct
+import threading
+import time
+import zlib
 from player import Player
 from enemy import Enemy
-from bullet import Bullet
+from bullet import BulletStore, BULLET_TYPE_CODES
 from powerup import PowerUp
 from mechanics import GrazingSystem, PowerUpSystem, EnemyBehavior
-from particle import Particle
+from particle import ParticleSystem
+from spatial_hash import SpatialHash
+from proximity import PlayerProximity
+from effects import EffectCache
+from renderer import SpriteBatchRenderer, DirtyRectPresenter
+from fonts import HudText, shared_text
+from profiler import TickProfiler
+from random_streams import RandomStreams
+from input_state import InputState
+from input_source import SHIELD_BUTTON, SWORD_BUTTON
+from pool import EntityPool
+from spawner import WaveSpawner
+from quality import QualityGovernor, QUALITY_TIERS
 from colors import Colors
 
+TICK_RATE = 60
+
 class Game:
-    def __init__(self, screen, joystick):
+    def __init__(self, screen, joystick, render_mode="full", screen_size=None, prewarm="now"):
+        # screen may be None for a headless game, which never draws and only
+        # needs the arena size; joystick is anything with get_axis/get_button.
+        # prewarm is "now", "background" (on a thread, joined before the first
+        # frame) or None to leave it to start_prewarm() or to first use.
         self.screen = screen
         self.joystick = joystick
-        self.screen_width, self.screen_height = screen.get_size()
+        self.screen_width, self.screen_height = screen.get_size() if screen is not None else screen_size
         self.player = Player(self.screen_width // 2, self.screen_height // 2, self.screen_width, self.screen_height)
-        self.bullets = []
-        self.enemy_bullets = []
+        self.bullets = BulletStore(self.screen_width, self.screen_height, friendly=True)
+        self.enemy_bullets = BulletStore(self.screen_width, self.screen_height)
         self.enemies = []
+        self.enemy_pool = EntityPool(Enemy)  # Killed enemies come back in later waves
+        self.released_enemies = []  # Dead this tick, back in the pool at the next flush
         self.powerups = []
-        self.particles = []
+        self.particles = ParticleSystem()
         self.score = 0
         self.wave = 1
+        self.tick = 0
+        # Every roll the simulation makes comes from these; reset() seeds them
+        self.rng = RandomStreams()
         self.graze_system = GrazingSystem()
         self.powerup_system = PowerUpSystem(self)
-        self.enemy_behavior = EnemyBehavior()
-        self.font = pygame.font.Font(None, 36)
+        self.enemy_behavior = EnemyBehavior(self.rng)
+        self.spawner = WaveSpawner(self)
+        # Boss radius is the largest entity size in the arena
+        self.enemy_grid = SpatialHash.for_arena(self.screen_width, self.screen_height, largest_size=30)
+        # What is near the player, measured by the collision step and read again by the graze step
+        self.proximity = PlayerProximity()
+
+        # One tick and one frame are these steps in order; a TickProfiler,
+        # when attached, times each of them under its name
+        self.update_steps = (
+            ("player", self.update_player),
+            ("bullets", self.update_bullets),
+            ("enemies", self.update_enemies),
+            ("powerups", self.update_powerups),
+            ("particles", self.update_particles),
+            ("collisions", self.check_collisions),
+            ("graze", self.update_graze),
+            ("waves", self.update_wave),
+        )
+        self.draw_steps = (
+            ("background", self.draw_background),
+            ("graze_zones", self.draw_graze_zones),
+            ("entities", self.draw_entities),
+            ("ui", self.draw_hud),
+            ("present", self.present),
+        )
+        self.profiler = None
+        self.frame_rects = []
+        self.alpha = 1.0
+        # Controller snapshot taken by each tick, and the one latched right
+        # before a frame is drawn; the latched aim only changes what is drawn
+        self.input = InputState()
+        self.latched_input = InputState()
+        self.latched_aim = None
+        # Time from the input a frame shows being read to that frame being presented
+        self.input_latency_ns = None
+        self.aim_latency_ns = None
+        # Effects the draw path may spend on; a governor, when attached, moves
+        # this between tiers from the frame times it is given
+        self.quality = QUALITY_TIERS[0]
+        self.governor = None
+        self.hud_rects = []  # Where the HUD was last drawn while it is throttled
+        self.hud_static = []  # Presented this frame without being restored next frame
+        self.hud_age = 0
+        self.hud_due = True
+        # What a frame is drawn from: the game itself, or a Snapshot of it
+        # published by a simulation thread
+        self.view = self
+        self.score_text = HudText(shared_text, 36, Colors.FOREGROUND, "Score: {}", lambda: self.view.score)
+        self.wave_text = HudText(shared_text, 36, Colors.FOREGROUND, "Wave: {}", lambda: self.view.wave)
+        self.health_text = HudText(shared_text, 36, Colors.FOREGROUND, "Health: {}",
+                                   lambda: self.view.player.hits_remaining)
+        self.weapon_text = HudText(shared_text, 36, Colors.FOREGROUND, "Weapon: {}",
+                                   lambda: self.view.player.current_weapon)
+        self.duration_text = HudText(shared_text, 36, Colors.FOREGROUND, "Duration: {}s",
+                                     lambda: self.view.player.powerup_timer // 60 + 1)
         
         # Create a slightly lighter background for the play area
         self.play_area_color = tuple(min(c + 10, 255) for c in Colors.BACKGROUND_COLOR)
         self.border_color = Colors.FOREGROUND
         self.border_width = 2
 
-    def reset(self):
+        # "full" redraws and flips every frame, "dirty" only repaints and
+        # presents the regions entities and HUD widgets touched, "offscreen"
+        # draws without presenting and "headless" never draws
+        self.render_mode = render_mode if screen is not None else "headless"
+        self.prewarm_thread = None
+        self.prewarm_ns = None
+        if self.render_mode != "headless":
+            self.init_rendering(prewarm)
+
+    def init_rendering(self, prewarm="now"):
+        self.effects = EffectCache()
+        self.renderer = SpriteBatchRenderer(self.effects)
+        if prewarm == "background":
+            self.start_prewarm()
+        elif prewarm == "now":
+            self.prewarm_effects()
+        self.background = self.compose_background()
+        self.presenter = DirtyRectPresenter(self.background)
+
+    def reset(self, seed=None):
+        # The same seed and the same per-tick input replay the same game
+        self.rng.reseed(seed)
         self.player = Player(self.screen_width // 2, self.screen_height // 2, self.screen_width, self.screen_height)
-        self.bullets = []
-        self.enemy_bullets = []
+        self.bullets.clear()
+        self.enemy_bullets.clear()
+        self.release_enemies(self.enemies)
+        self.flush_released_enemies()
         self.enemies = []
         self.powerups = []
-        self.particles = []
+        self.particles.clear()
         self.score = 0
         self.wave = 1
+        self.tick = 0
         self.graze_system = GrazingSystem()
+        self.proximity = PlayerProximity()
         self.powerup_system.reset()
+        self.spawner.reset()
         self.spawn_enemies()
+        self.invalidate_screen()
+
+    def attach_profiler(self, stream_path=None):
+        self.profiler = TickProfiler([name for name, _ in self.update_steps], [name for name, _ in self.draw_steps],
+                                     stream_path=stream_path)
+        return self.profiler
+
+    def compose_background(self):
+        background = pygame.Surface((self.screen_width, self.screen_height))
+        background.fill(Colors.BACKGROUND_COLOR)
+
+        # Draw the play area with a slightly lighter background
+        pygame.draw.rect(background, self.play_area_color, (0, 0, self.screen_width, self.screen_height))
+
+        # Draw the border
+        pygame.draw.rect(background, self.border_color, (0, 0, self.screen_width, self.screen_height), self.border_width)
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        return background
+
+    def attach_governor(self, budget_ms=1000 / 60):
+        self.governor = QualityGovernor(budget_ms)
+        self.set_quality(self.governor.tier)
+
+    def set_quality(self, tier):
+        self.quality = tier
+        # The throttled HUD is not tracked by the presenter, repaint from scratch
+        self.hud_rects = []
+        self.invalidate_screen()
+
+    def record_frame(self, frame_ns):
+        if self.governor is not None and self.governor.record(frame_ns):
+            self.set_quality(self.governor.tier)
+
+    def invalidate_screen(self):
+        # Something else (a menu) drew over the screen, repaint all of it next frame
+        if self.render_mode != "headless":
+            self.presenter.invalidate()
+
+    def start_prewarm(self):
+        if self.render_mode == "headless" or self.prewarm_thread is not None or self.prewarm_ns is not None:
+            return
+        self.prewarm_thread = threading.Thread(target=self.prewarm_effects, name="prewarm", daemon=True)
+        self.prewarm_thread.start()
+
+    def finish_prewarm(self):
+        # The sprite caches are not shared between threads
+        if self.prewarm_thread is not None:
+            self.prewarm_thread.join()
+            self.prewarm_thread = None
+
+    def prewarm_effects(self):
+        # Render every glow and graze arc the draw path can ask for up front
+        start = time.perf_counter_ns()
+        glow_timers = range(1, 31)
+        self.effects.prewarm_glows([Colors.BULLET_COLOR, Colors.ENEMY_COLOR],
+                                   sorted({self.bullets.size + t // 5 for t in glow_timers}))
+        self.effects.prewarm_glows([Colors.PLAYER_COLOR], sorted({self.player.size + t // 5 for t in glow_timers}))
+        rings = self.graze_system.graze_rings
+        self.effects.prewarm_arcs([Colors.GRAZE_INNER_COLOR, Colors.GRAZE_OUTER_COLOR],
+                                  self.graze_system.outer_graze_distance,
+                                  [rings.bucket_angle(b) for b in range(rings.buckets)])
+        self.effects.prewarm_rings([Colors.GRAZE_INNER_COLOR, Colors.GRAZE_OUTER_COLOR],
+                                   [self.graze_system.inner_graze_distance, self.graze_system.outer_graze_distance])
+
+        # Entity sprites for the batched renderer
+        for color in (Colors.BULLET_COLOR, Colors.ENEMY_COLOR):
+            self.renderer.circle(color, self.bullets.size)
+        for step in range(self.renderer.angle_steps):
+            self.renderer.laser(Colors.BULLET_COLOR, 40, step)  # Laser shots travel at speed 20
+        self.renderer.circle(Colors.ENEMY_COLOR, Enemy.size_for("normal"))
+        self.renderer.circle(Colors.BOSS_COLOR, Enemy.size_for("boss"))
+        for powerup_type in Colors.POWERUP_COLORS:
+            powerup = PowerUp(0, 0, powerup_type)
+            self.renderer.powerup_body(powerup)
+            for pulse in range(-3, 4):
+                self.renderer.circle(powerup.get_color(), powerup.size + pulse, 2)
+        self.renderer.circle(self.particles.color, self.particles.size)
+        self.prewarm_ns = time.perf_counter_ns() - start
 
     def handle_input(self):
         if not self.player.alive:
             return
 
-        move_x = self.joystick.get_axis(0)
-        move_y = self.joystick.get_axis(1)
-        self.player.move(move_x, move_y)
+        state = self.input.sample(self.joystick)
+        self.player.move(state.move_x, state.move_y)
 
-        aim_x = self.joystick.get_axis(2)
-        aim_y = self.joystick.get_axis(3)
-        if abs(aim_x) > 0.1 or abs(aim_y) > 0.1:
-            self.player.aim(math.atan2(aim_y, aim_x))
+        if state.aiming():
+            self.player.aim(state.aim_angle())
 
-        if self.joystick.get_axis(5) > 0.5:
-            self.player.shoot(self.bullets)
+        if state.firing():
+            self.player.shoot(self.bullets, self.rng.player)
 
-        if self.joystick.get_button(5):
+        if state.pressed(SWORD_BUTTON):
             if self.player.sword_attack():
                 self.check_sword_collision()
 
-        if self.joystick.get_button(4):
+        if state.pressed(SHIELD_BUTTON):
             self.player.activate_shield()
 
+    def latch_input(self, joystick):
+        # Re-reads the controller as late as possible before drawing so the
+        # aim shown is at most one frame old, independent of how many ticks
+        # ran this frame. The simulation still aims from its own tick sample,
+        # which keeps recordings replayable.
+        state = self.latched_input.sample(joystick)
+        self.latched_aim = state.aim_angle() if state.aiming() else None
+
     def update_game_state(self):
         if not self.player.alive:
             return
 
-        self.player.update()
-        self.update_bullets()
-        self.update_enemies()
-        self.update_powerups()
-        self.update_particles()
-        self.check_collisions()
-        self.graze_system.update(self.player, self.enemy_bullets, self.enemies)
+        self.tick += 1
 
-        if self.graze_system.add_meter(0):  # Only level up if meter is full
-            self.player.hits_remaining += 1
+        if self.profiler is None:
+            for _, step in self.update_steps:
+                step()
+        else:
+            self.profiler.start_tick(self)
+            self.profiler.run_steps(self.update_steps, "tick")
 
-        if len(self.enemies) == 0:
-            self.wave += 1
-            self.spawn_enemies()
+    def update_player(self):
+        self.player.update()
 
     def update_bullets(self):
-        for bullet in self.bullets[:]:
-            if bullet.bullet_type == "homing":
-                closest_enemy = min(self.enemies, key=lambda e: math.hypot(e.x - bullet.x, e.y - bullet.y), default=None)
-                bullet.update(closest_enemy)
-            else:
-                bullet.update()
-            if not bullet.is_on_screen(self.screen_width, self.screen_height) or bullet.lifetime <= 0:
-                self.bullets.remove(bullet)
-
-        for bullet in self.enemy_bullets[:]:
-            bullet.update()
-            if not bullet.is_on_screen(self.screen_width, self.screen_height) or bullet.lifetime <= 0:
-                self.enemy_bullets.remove(bullet)
-                
+        bullets = self.bullets
+        homing = bullets.rows_of_type("homing")
+        if len(homing) and self.enemies:
+            # Targets are sticky: only bullets whose target died look for a new one
+            targets = bullets.target
+            lost = [i for i in homing.tolist() if targets[i] is None or targets[i].health <= 0]
+            if lost:
+                enemies = self.enemies
+                self.enemy_grid.rebuild([e.x for e in enemies], [e.y for e in enemies], [e.size for e in enemies])
+                for i, e in zip(lost, self.enemy_grid.nearest(bullets.x[lost], bullets.y[lost]).tolist()):
+                    targets[i] = enemies[e]
+            tracked = targets[homing]
+            bullets.steer(homing, [e.x for e in tracked], [e.y for e in tracked])
+
+        self.bullets.update()
+        self.enemy_bullets.update()
+
     def update_enemies(self):
-        for enemy in self.enemies[:]:
-            self.enemy_behavior.update(enemy, self.player, self.enemy_bullets, self.score)
+        self.enemy_behavior.clock_ms = self.tick * 1000 // TICK_RATE
+        for enemy in self.enemies:
+            enemy.prev_x, enemy.prev_y = enemy.x, enemy.y
+        self.enemy_behavior.update_all(self.enemies, self.player, self.enemy_bullets, self.score)
 
     def update_powerups(self):
         self.powerup_system.update(self.player, self.graze_system.level, self.wave)
         self.powerups = self.powerup_system.powerups
 
     def update_particles(self):
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
 
     def check_collisions(self):
-        for bullet in self.bullets[:]:
-            for enemy in self.enemies[:]:
-                if bullet.collides_with(enemy):
-                    enemy.take_damage(bullet.damage)
-                    if bullet.bullet_type != "piercing":
-                        self.bullets.remove(bullet)
-                    if enemy.health <= 0:
-                        self.enemies.remove(enemy)
-                        self.score += enemy.score_value
-                        self.add_particles(enemy.x, enemy.y)
-                    break
-
-        for bullet in self.enemy_bullets[:]:
-            if self.player.collides_with(bullet):
-                if self.player.shield_active:
-                    self.enemy_bullets.remove(bullet)
-                else:
-                    self.player.take_damage()
-                    self.enemy_bullets.remove(bullet)
-
-        for enemy in self.enemies[:]:
-            if self.player.collides_with(enemy):
-                if not self.player.shield_active:
-                    self.player.take_damage()
-
-        for powerup in self.powerups[:]:
-            if self.player.collides_with(powerup):
-                self.powerup_system.activate_powerup(self.player, powerup.type)
-                self.powerups.remove(powerup)
+        player = self.player
+        bullets = self.bullets
+        enemy_bullets = self.enemy_bullets
+        enemies = self.enemies
+        powerups = self.powerups
+
+        # Player bullets against enemies go through the grid; everything
+        # against the player is one distance pass, shared with grazing.
+        # Nothing is mutated until every scan is done
+        self.enemy_grid.rebuild([e.x for e in enemies], [e.y for e in enemies], [e.size for e in enemies])
+        hit_bullets, hit_enemies = self.enemy_grid.query(bullets.x[:bullets.count], bullets.y[:bullets.count],
+                                                         bullets.size)
+        proximity = self.proximity
+        graze = self.graze_system
+        proximity.measure(player, enemy_bullets, enemies, powerups,
+                          graze.inner_graze_distance, graze.outer_graze_distance)
+        bullets_on_player = proximity.bullets_hit
+        enemies_on_player = proximity.enemies_hit
+        picked_powerups = proximity.powerups_picked
+
+        # Each bullet damages the first enemy (in list order) still alive
+        piercing = BULLET_TYPE_CODES["piercing"]
+        spent = []
+        last_bullet = -1
+        for b, e in zip(hit_bullets.tolist(), hit_enemies.tolist()):
+            enemy = enemies[e]
+            if b == last_bullet or enemy.health <= 0:
+                continue
+            last_bullet = b
+            enemy.take_damage(int(bullets.damage[b]))
+            if bullets.type[b] != piercing:
+                spent.append(b)
+        bullets.kill(spent)
+        bullets.compact()
+
+        # take_damage is a no-op while the shield is up, the bullet is absorbed either way
+        for _ in bullets_on_player:
+            player.take_damage()
+        enemy_bullets.kill(bullets_on_player)
+        enemy_bullets.compact()
+
+        for e in enemies_on_player.tolist():
+            if enemies[e].health > 0:
+                player.take_damage()
+
+        killed = [enemy for enemy in enemies if enemy.health <= 0]
+        if killed:
+            enemies[:] = [enemy for enemy in enemies if enemy.health > 0]
+            for enemy in killed:
+                self.score += enemy.score_value
+            self.add_particles([enemy.x for enemy in killed], [enemy.y for enemy in killed])
+            self.release_enemies(killed)
+
+        picked = [powerups[i] for i in picked_powerups.tolist()]
+        if picked:
+            powerups[:] = [powerup for powerup in powerups if powerup not in picked]
+            for powerup in picked:
+                self.powerup_system.activate_powerup(player, powerup.type)
+
+    def update_graze(self):
+        # One extra hit per graze level gained
+        self.player.hits_remaining += self.graze_system.update(self.player, self.proximity)
+
+    def update_wave(self):
+        # Spawning may hand out pooled enemies, so this tick's dead go back first
+        self.flush_released_enemies()
+        # A wave is over once it is all spawned and all dead
+        if len(self.enemies) == 0 and not self.spawner.pending:
+            self.wave += 1
+            self.spawner.start(self.wave)
+        self.spawner.update(self.wave)
+
+    def state_checksum(self):
+        # A fingerprint of the simulation state, compared between a recorded
+        # game and its replay to find the first tick where they diverge
+        player = self.player
+        crc = zlib.crc32(struct.pack("<4q3d", self.tick, self.score, self.wave, player.hits_remaining,
+                                     player.x, player.y, player.angle))
+        for store in (self.bullets, self.enemy_bullets):
+            crc = zlib.crc32(store.x[:store.count].tobytes(), crc)
+            crc = zlib.crc32(store.y[:store.count].tobytes(), crc)
+        for enemy in self.enemies:
+            crc = zlib.crc32(struct.pack("<3d", enemy.x, enemy.y, enemy.health), crc)
+        for powerup in self.powerups:
+            crc = zlib.crc32(struct.pack("<2d", powerup.x, powerup.y), crc)
+        return crc
 
     def check_sword_collision(self):
         sword_rect = pygame.Rect(
@@ -157,86 +403,153 @@ class Game:
         for enemy in self.enemies[:]:
             if sword_rect.collidepoint(enemy.x, enemy.y):
                 enemy.take_damage(self.player.sword_damage)
-                self.graze_system.add_meter(10)
+                self.player.hits_remaining += self.graze_system.add_meter(10)
                 if enemy.health <= 0:
                     self.enemies.remove(enemy)
                     self.score += enemy.score_value
+                    self.release_enemies([enemy])
 
     def spawn_enemies(self):
-        num_enemies = self.wave * 2
-        for _ in range(num_enemies):
-            enemy_type = self.enemy_behavior.get_enemy_type(self.graze_system.level)
-            self.enemies.append(Enemy(enemy_type, self.screen_width, self.screen_height))
-
-    def draw_game(self):
-        self.screen.fill(Colors.BACKGROUND_COLOR)
-        
-        # Draw the play area with a slightly lighter background
-        pygame.draw.rect(self.screen, self.play_area_color, (0, 0, self.screen_width, self.screen_height))
-        
-        # Draw the border
-        pygame.draw.rect(self.screen, self.border_color, (0, 0, self.screen_width, self.screen_height), self.border_width)
-        
-        self.graze_system.draw_graze_zones(self.screen, self.player)
-        
-        self.player.draw(self.screen)
-
-        for bullet in self.bullets:
-            bullet.draw(self.screen)
-
-        for bullet in self.enemy_bullets:
-            bullet.draw(self.screen)
-
-        for enemy in self.enemies:
-            enemy.draw(self.screen, Colors.BOSS_COLOR, Colors.ENEMY_COLOR)
-
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
-
-        for particle in self.particles:
-            particle.draw(self.screen)
-
-        self.draw_ui()
-
-        pygame.display.flip()
-
-    def update_game_state(self):
-        if not self.player.alive:
+        # The whole wave in this tick; update_wave streams every wave after the first
+        self.spawner.start(self.wave)
+        self.spawner.release(self.spawner.pending)
+
+    def release_enemies(self, enemies):
+        # A pooled enemy comes back as a different one, so boss emitters let
+        # go of it now and homing bullets at the next flush; until then a
+        # bullet aimed at it sees it dead and picks a new target
+        emitters = self.enemy_behavior.boss_emitters
+        for enemy in enemies:
+            emitters.pop(enemy, None)
+        self.released_enemies.extend(enemies)
+
+    def flush_released_enemies(self):
+        # One pass over the target column for everything released since the last flush
+        released = self.released_enemies
+        if not released:
             return
-
-        self.player.update()
-        self.update_bullets()
-        self.update_enemies()
-        self.update_powerups()
-        self.update_particles()
-        self.check_collisions()
-        graze_level_up = self.graze_system.update(self.player, self.enemy_bullets, self.enemies)
-
-        if graze_level_up:
-            self.player.hits_remaining += 1
-
-        if len(self.enemies) == 0:
-            self.wave += 1
-            self.spawn_enemies()
+        targets = self.bullets.target[:self.bullets.count]
+        target_ids = np.fromiter(map(id, targets), dtype=np.uint64, count=len(targets))
+        released_ids = np.fromiter(map(id, released), dtype=np.uint64, count=len(released))
+        targets[np.isin(target_ids, released_ids)] = None
+        self.enemy_pool.release_all(released)
+        self.released_enemies = []
+
+    def pool_stats(self):
+        return {
+            "enemies": self.enemy_pool.stats(),
+            "bullets": {"live": len(self.bullets), "high_water": self.bullets.high_water,
+                        "capacity": self.bullets.capacity},
+            "enemy_bullets": {"live": len(self.enemy_bullets), "high_water": self.enemy_bullets.high_water,
+                              "capacity": self.enemy_bullets.capacity},
+            "particles": {"live": len(self.particles), "high_water": self.particles.high_water,
+                          "capacity": self.particles.capacity, "evicted": self.particles.evicted},
+        }
+
+    def draw_game(self, alpha=1.0, view=None):
+        # alpha is how far the frame lies between the last two ticks, entities
+        # are drawn that far from their previous position to their current one
+        if self.render_mode == "headless":
+            return
+        self.finish_prewarm()
+        self.alpha = alpha
+        self.view = self if view is None else view
+        self.frame_rects = []
+        if self.profiler is None:
+            for _, step in self.draw_steps:
+                step()
+        else:
+            self.profiler.run_steps(self.draw_steps, "frame", self.latency_samples)
+
+    def draw_background(self):
+        if self.render_mode == "dirty":
+            self.presenter.restore(self.screen)
+            self.renderer.dirty_rects = self.frame_rects
+            if self.quality.hud_interval > 1:
+                self.schedule_hud()
+        else:
+            self.screen.blit(self.background, (0, 0))
+
+    def schedule_hud(self):
+        # While throttled the HUD stays on screen between redraws instead of
+        # being restored with the entity rects. It is redrawn every
+        # hud_interval frames, or early when the restore just erased part of it.
+        self.hud_age += 1
+        erased = self.presenter.previous
+        self.hud_due = (not self.hud_rects or self.hud_age >= self.quality.hud_interval or self.presenter.needs_full
+                        or any(rect.collidelist(self.hud_rects) >= 0 for rect in erased))
+        if self.hud_due:
+            self.screen.blits([(self.background, rect, rect) for rect in self.hud_rects], doreturn=False)
+            self.hud_static.extend(self.hud_rects)
+            self.hud_age = 0
+
+    def draw_graze_zones(self):
+        view = self.view
+        self.frame_rects.extend(view.graze_system.draw_graze_zones(self.screen, view.player, self.effects,
+                                                                   merged=not self.quality.graze_arcs))
+
+    def draw_entities(self):
+        alpha = self.alpha
+        view = self.view
+        self.frame_rects.append(view.player.draw(self.screen, self.effects, alpha, self.latched_aim))
+        glow = self.quality.glow
+        self.renderer.draw_bullets(self.screen, view.bullets, alpha, glow)
+        self.renderer.draw_bullets(self.screen, view.enemy_bullets, alpha, glow)
+        self.renderer.draw_enemies(self.screen, view.enemies, alpha)
+        self.renderer.draw_powerups(self.screen, view.powerups, self.quality.pulse)
+        self.renderer.draw_particles(self.screen, view.particles, alpha)
+
+    def draw_hud(self):
+        if self.render_mode == "dirty" and self.quality.hud_interval > 1:
+            if self.hud_due:
+                self.hud_rects = self.draw_ui()
+                self.hud_static.extend(self.hud_rects)
+        else:
+            self.frame_rects.extend(self.draw_ui())
+        if self.profiler is not None and self.profiler.overlay_visible:
+            self.frame_rects.append(self.profiler.draw_overlay(self.screen))
+
+    def present(self):
+        if self.render_mode == "dirty":
+            self.renderer.dirty_rects = None
+            self.presenter.present(self.frame_rects, self.hud_static)
+            self.hud_static = []
+        elif self.render_mode == "full":
+            pygame.display.flip()
+        # Ages of the tick input the drawn state was built from (a snapshot's,
+        # under a simulation thread) and of the aim shown; None before any
+        # input was read
+        presented = time.perf_counter_ns()
+        tick_sampled_ns = self.view.input_sampled_ns
+        aim_sampled_ns = self.latched_input.sampled_ns if self.latched_aim is not None else tick_sampled_ns
+        self.input_latency_ns = presented - tick_sampled_ns if tick_sampled_ns else None
+        self.aim_latency_ns = presented - aim_sampled_ns if aim_sampled_ns else None
+
+    @property
+    def input_sampled_ns(self):
+        return self.input.sampled_ns
+
+    def latency_samples(self):
+        # Recorded with the frame's draw timings, once present has run
+        return tuple((name, ns) for name, ns in (("input_latency", self.input_latency_ns),
+                                                  ("aim_latency", self.aim_latency_ns)) if ns is not None)
 
     def draw_ui(self):
-        score_text = self.font.render(f"Score: {self.score}", True, Colors.FOREGROUND)
-        self.screen.blit(score_text, (10, 10))
+        drawn = [self.screen.blit(self.score_text.surface(), (10, 10))]
 
-        wave_text = self.font.render(f"Wave: {self.wave}", True, Colors.FOREGROUND)
-        self.screen.blit(wave_text, (10, 50))
+        drawn.append(self.screen.blit(self.wave_text.surface(), (10, 50)))
 
-        self.graze_system.draw(self.screen, self.screen_width)
+        drawn.extend(self.view.graze_system.draw(self.screen, self.screen_width))
 
-        health_text = self.font.render(f"Health: {self.player.hits_remaining}", True, Colors.FOREGROUND)
-        self.screen.blit(health_text, (self.screen_width - 150, 10))
+        drawn.append(self.screen.blit(self.health_text.surface(), (self.screen_width - 150, 10)))
 
-        weapon_text = self.font.render(f"Weapon: {self.player.current_weapon}", True, Colors.FOREGROUND)
-        self.screen.blit(weapon_text, (self.screen_width // 2 - weapon_text.get_width() // 2, 10))
+        weapon_text = self.weapon_text.surface()
+        drawn.append(self.screen.blit(weapon_text, (self.screen_width // 2 - weapon_text.get_width() // 2, 10)))
 
-        if self.player.powerup_timer > 0:
-            duration_text = self.font.render(f"Duration: {self.player.powerup_timer // 60 + 1}s", True, Colors.FOREGROUND)
-            self.screen.blit(duration_text, (self.screen_width // 2 - duration_text.get_width() // 2, 50))
+        if self.view.player.powerup_timer > 0:
+            duration_text = self.duration_text.surface()
+            drawn.append(self.screen.blit(duration_text, (self.screen_width // 2 - duration_text.get_width() // 2, 50)))
+        return drawn
 
     def activate_bomb(self):
         for enemy in self.enemies[:]:
@@ -244,18 +557,18 @@ class Game:
             if enemy.health <= 0:
                 self.enemies.remove(enemy)
                 self.score += enemy.score_value
+                self.release_enemies([enemy])
         self.enemy_bullets.clear()
+        self.proximity.clear_bullets()
 
     def clear_screen(self):
         self.enemy_bullets.clear()
+        self.proximity.clear_bullets()
         for enemy in self.enemies:
             enemy.take_damage(enemy.health)
         self.score += len(self.enemies) * 10
+        self.release_enemies(self.enemies)
         self.enemies.clear()
 
     def add_particles(self, x, y):
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            lifetime = random.randint(30, 60)
-            self.particles.append(Particle(x, y, angle, speed, lifetime))
\ No newline at end of file
+        self.particles.emit(x, y, self.rng.particles, self.quality.particles_per_burst)
@@ -0,0 +1,93 @@
+import argparse
+import os
+import sys
+import time
+
+# The simulation never opens a window; keep SDL off any real device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from game import Game
+from input_source import INPUT_SOURCES, RandomInput, RecordedInput
+
+DEFAULT_SCREEN_SIZE = (1920, 1080)
+
+def create_input(kind, seed=0, path=None):
+    if kind == "random":
+        return RandomInput(seed)
+    if kind == "recorded":
+        return RecordedInput.load(path)
+    return INPUT_SOURCES[kind]()
+
+def create_game(source, screen_size=DEFAULT_SCREEN_SIZE, screen=None, render_mode="headless", seed=0):
+    if not pygame.get_init():
+        pygame.init()
+    game = Game(screen, source, render_mode=render_mode, screen_size=screen_size)
+    game.reset(seed)
+    return game
+
+def run(game, source, max_ticks, stop_on_death=True, on_tick=None):
+    # Ticks back to back with no frame pacing, as fast as the CPU allows
+    peak_entities = 0
+    ticks = 0
+    start = time.perf_counter()
+    while ticks < max_ticks:
+        if stop_on_death and not game.player.alive:
+            break
+        game.handle_input()
+        game.update_game_state()
+        ticks += 1
+        if on_tick is not None:
+            on_tick(game, ticks)
+        source.advance()
+        entities = len(game.bullets) + len(game.enemy_bullets) + len(game.enemies) + len(game.particles)
+        peak_entities = max(peak_entities, entities)
+    elapsed = time.perf_counter() - start
+    return {
+        "ticks": ticks,
+        "seconds": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else 0.0,
+        "wave": game.wave,
+        "score": game.score,
+        "alive": game.player.alive,
+        "peak_entities": peak_entities,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the simulation without a display")
+    parser.add_argument("--ticks", type=int, default=3600, help="maximum ticks to simulate")
+    parser.add_argument("--input", choices=sorted(INPUT_SOURCES) + ["recorded"], default="random")
+    parser.add_argument("--recording", help="input file for --input recorded")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", default="%dx%d" % DEFAULT_SCREEN_SIZE, help="arena size as WIDTHxHEIGHT")
+    parser.add_argument("--keep-running", action="store_true", help="keep ticking after the player dies")
+    parser.add_argument("--profile-out", help="stream per-tick update timings to this .csv or .ndjson file")
+    parser.add_argument("--pool-stats", action="store_true", help="print entity pool and store usage at the end")
+    args = parser.parse_args(argv)
+
+    if args.input == "recorded" and not args.recording:
+        parser.error("--input recorded needs --recording")
+    screen_size = tuple(int(n) for n in args.size.lower().split("x"))
+    source = create_input(args.input, args.seed, args.recording)
+    game = create_game(source, screen_size, seed=args.seed)
+    if args.profile_out:
+        game.attach_profiler(args.profile_out)
+    stats = run(game, source, args.ticks, stop_on_death=not args.keep_running)
+    print(f"{stats['ticks']} ticks in {stats['seconds']:.2f}s ({stats['ticks_per_second']:.0f} ticks/s), "
+          f"wave {stats['wave']}, score {stats['score']}, peak entities {stats['peak_entities']}, "
+          f"{'alive' if stats['alive'] else 'dead'}")
+    if game.profiler is not None:
+        game.profiler.close()
+        for name in game.profiler.update_sections + ("tick",):
+            p50, p95, p99 = game.profiler.percentiles(name)
+            print(f"  {name:<12} p50 {p50:.3f}  p95 {p95:.3f}  p99 {p99:.3f} ms")
+    if args.pool_stats:
+        for name, pool in game.pool_stats().items():
+            print(f"  {name:<14} " + "  ".join(f"{key} {value:.2f}" if isinstance(value, float) else f"{key} {value}"
+                                               for key, value in pool.items()))
+    pygame.quit()
+
+if __name__ == "__main__":
+    sys.exit(main())
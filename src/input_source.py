@@ -0,0 +1,119 @@
+import json
+import math
+import random
+
+# Controller layout used by Game.handle_input
+AXIS_COUNT = 6
+BUTTON_COUNT = 8
+MOVE_X, MOVE_Y, AIM_X, AIM_Y, LEFT_TRIGGER, RIGHT_TRIGGER = range(AXIS_COUNT)
+SHIELD_BUTTON, SWORD_BUTTON = 4, 5
+
+class InputSource:
+    # A virtual controller with the same get_axis/get_button interface as
+    # pygame.joystick.Joystick. advance() moves it on by one simulation tick.
+    def __init__(self):
+        self.axes = [0.0] * AXIS_COUNT
+        self.buttons = [0] * BUTTON_COUNT
+        self.tick = 0
+
+    def init(self):
+        pass
+
+    def get_axis(self, axis):
+        return self.axes[axis]
+
+    def get_button(self, button):
+        return self.buttons[button]
+
+    def advance(self):
+        self.tick += 1
+
+class IdleInput(InputSource):
+    pass
+
+class ScriptedInput(InputSource):
+    # Plays a list of (ticks, axes, buttons) segments in a loop, where axes
+    # and buttons are {index: value} overrides on a neutral controller
+    DEFAULT_SCRIPT = [
+        (120, {MOVE_X: 1.0, AIM_Y: -1.0, RIGHT_TRIGGER: 1.0}, {}),
+        (120, {MOVE_Y: 1.0, AIM_X: -1.0, RIGHT_TRIGGER: 1.0}, {SWORD_BUTTON: 1}),
+        (120, {MOVE_X: -1.0, AIM_Y: 1.0, RIGHT_TRIGGER: 1.0}, {}),
+        (120, {MOVE_Y: -1.0, AIM_X: 1.0, RIGHT_TRIGGER: 1.0}, {SHIELD_BUTTON: 1}),
+    ]
+
+    def __init__(self, script=None):
+        super().__init__()
+        self.script = script or self.DEFAULT_SCRIPT
+        self.segment = 0
+        self.segment_ticks = 0
+        self.apply_segment()
+
+    def apply_segment(self):
+        _, axes, buttons = self.script[self.segment]
+        self.axes = [axes.get(i, 0.0) for i in range(AXIS_COUNT)]
+        self.buttons = [buttons.get(i, 0) for i in range(BUTTON_COUNT)]
+
+    def advance(self):
+        super().advance()
+        self.segment_ticks += 1
+        if self.segment_ticks >= self.script[self.segment][0]:
+            self.segment = (self.segment + 1) % len(self.script)
+            self.segment_ticks = 0
+            self.apply_segment()
+
+class RandomInput(InputSource):
+    # Seeded random play: re-rolls the sticks every few ticks, mostly firing
+    def __init__(self, seed=0, hold_ticks=(10, 60), fire_chance=0.8):
+        super().__init__()
+        self.random = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.fire_chance = fire_chance
+        self.next_change = 0
+
+    def advance(self):
+        super().advance()
+        if self.tick < self.next_change:
+            return
+        self.next_change = self.tick + self.random.randint(*self.hold_ticks)
+        move_angle = self.random.uniform(0, 2 * math.pi)
+        aim_angle = self.random.uniform(0, 2 * math.pi)
+        move_strength = self.random.random()
+        self.axes[MOVE_X] = math.cos(move_angle) * move_strength
+        self.axes[MOVE_Y] = math.sin(move_angle) * move_strength
+        self.axes[AIM_X] = math.cos(aim_angle)
+        self.axes[AIM_Y] = math.sin(aim_angle)
+        self.axes[RIGHT_TRIGGER] = 1.0 if self.random.random() < self.fire_chance else -1.0
+        self.buttons[SWORD_BUTTON] = int(self.random.random() < 0.1)
+        self.buttons[SHIELD_BUTTON] = int(self.random.random() < 0.05)
+
+class RecordedInput(InputSource):
+    # Replays per-tick controller states; holds neutral once they run out
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+        self.apply_frame()
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(list(zip(data["axes"], data["buttons"])))
+
+    def apply_frame(self):
+        if self.tick < len(self.frames):
+            axes, buttons = self.frames[self.tick]
+            self.axes = list(axes)
+            self.buttons = list(buttons)
+        else:
+            self.axes = [0.0] * AXIS_COUNT
+            self.buttons = [0] * BUTTON_COUNT
+
+    def advance(self):
+        super().advance()
+        self.apply_frame()
+
+INPUT_SOURCES = {
+    "idle": IdleInput,
+    "scripted": ScriptedInput,
+    "random": RandomInput,
+}
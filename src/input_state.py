@@ -0,0 +1,49 @@
+import math
+import time
+from input_source import (AXIS_COUNT, BUTTON_COUNT, MOVE_X, MOVE_Y, AIM_X, AIM_Y, LEFT_TRIGGER, RIGHT_TRIGGER)
+
+AIM_DEADZONE = 0.1
+FIRE_THRESHOLD = 0.5
+
+class InputState:
+    # The whole controller read at one instant: the six axes, the buttons as a
+    # bitmask and the perf_counter_ns time of the read. Game reads these
+    # fields instead of going back to the device for every control.
+    __slots__ = ("move_x", "move_y", "aim_x", "aim_y", "left_trigger", "right_trigger", "buttons", "sampled_ns")
+
+    def __init__(self):
+        self.move_x = self.move_y = self.aim_x = self.aim_y = 0.0
+        self.left_trigger = self.right_trigger = 0.0
+        self.buttons = 0
+        self.sampled_ns = 0
+
+    def sample(self, joystick):
+        # pygame joysticks may have fewer axes or buttons than the layout
+        num_axes = joystick.get_numaxes() if hasattr(joystick, "get_numaxes") else AXIS_COUNT
+        num_buttons = joystick.get_numbuttons() if hasattr(joystick, "get_numbuttons") else BUTTON_COUNT
+        axes = [joystick.get_axis(i) if i < num_axes else 0.0 for i in range(AXIS_COUNT)]
+        self.move_x = axes[MOVE_X]
+        self.move_y = axes[MOVE_Y]
+        self.aim_x = axes[AIM_X]
+        self.aim_y = axes[AIM_Y]
+        self.left_trigger = axes[LEFT_TRIGGER]
+        self.right_trigger = axes[RIGHT_TRIGGER]
+        mask = 0
+        for i in range(min(num_buttons, BUTTON_COUNT)):
+            if joystick.get_button(i):
+                mask |= 1 << i
+        self.buttons = mask
+        self.sampled_ns = time.perf_counter_ns()
+        return self
+
+    def pressed(self, button):
+        return bool(self.buttons >> button & 1)
+
+    def aiming(self):
+        return abs(self.aim_x) > AIM_DEADZONE or abs(self.aim_y) > AIM_DEADZONE
+
+    def aim_angle(self):
+        return math.atan2(self.aim_y, self.aim_x)
+
+    def firing(self):
+        return self.right_trigger > FIRE_THRESHOLD
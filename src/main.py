@@ -1,89 +1,253 @@
+import time
+STARTUP_NS = time.perf_counter_ns()  # Before the heavy imports, for --profile-startup
+
+import argparse
+import os
 import pygame
 import sys
+import menus
 from game import Game
 from menus import main_menu, pause_menu, game_over_menu, guide_menu
+from profiler import StartupProfiler
+from replay import InputRecorder
+from timestep import FixedTimestep
+from sim_thread import SimulationThread
+from quality import QUALITY_TIER_NAMES
 
-# Initialize Pygame
-pygame.init()
-pygame.joystick.init()
+# "dirty" presents only changed regions, "full" redraws and flips every frame
+RENDER_MODE = "dirty"
 
-# Set up display
-infoObject = pygame.display.Info()
-SCREEN_WIDTH, SCREEN_HEIGHT = infoObject.current_w, infoObject.current_h
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-pygame.display.set_caption("Twin Stick Shooter")
+PROFILE_OVERLAY_BUTTON = 6  # Back button
+MAX_SUBSTEPS = 5  # Simulation ticks a single frame may run before time is dropped
 
-# Initialize joystick
+# Set by main(); importing this module does not touch pygame
+screen = None
 joystick = None
-try:
-    if pygame.joystick.get_count() > 0:
-        joystick = pygame.joystick.Joystick(0)
-        joystick.init()
-    else:
+
+def init_display():
+    # Only the subsystems the game uses; pygame.init() would also bring up audio
+    pygame.display.init()
+    pygame.font.init()
+    info = pygame.display.Info()
+    surface = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+    pygame.display.set_caption("Twin Stick Shooter")
+    return surface
+
+def init_joystick():
+    pygame.joystick.init()
+    try:
+        if pygame.joystick.get_count() > 0:
+            device = pygame.joystick.Joystick(0)
+            device.init()
+            return device
         print("No joystick detected. Please connect a joystick and restart the game.")
+    except pygame.error as e:
+        print(f"Joystick error: {e}")
+        print("The game requires a joystick to play. Please connect one and restart the game.")
+    return None
+
+def show_menu(profile, menu, *args):
+    # With --profile, prints how long the menu slept in event.wait against
+    # how long it was awake, and the process CPU it used meanwhile
+    menus.menu_stats.reset()
+    result = menu(*args)
+    if profile:
+        print(menus.menu_stats.summary(menu.__name__.replace("_menu", "")))
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Twin Stick Shooter")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every update and render step (F3 or Back toggles the overlay)")
+    parser.add_argument("--profile-out", help="stream per-tick timings to this .csv or .ndjson file")
+    parser.add_argument("--record", metavar="DIR", help="write an input log of every game to this directory")
+    parser.add_argument("--fps", type=int, default=0,
+                        help="frame rate cap, 0 for none; the simulation always runs at 60 ticks/s")
+    parser.add_argument("--quality", choices=["auto"] + list(QUALITY_TIER_NAMES), default="auto",
+                        help="effect quality tier, or auto to step between tiers to hold the frame budget")
+    parser.add_argument("--frame-budget", type=float, default=1000 / 60, metavar="MS",
+                        help="frame time the auto quality governor aims to stay under")
+    parser.add_argument("--threaded", action="store_true",
+                        help="run the simulation on its own thread and draw from its latest snapshot")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print the time spent in each startup phase up to the first menu frame")
+    parser.add_argument("--startup-budget", type=float, metavar="MS",
+                        help="time to first menu to compare --profile-startup against")
+    args = parser.parse_args(argv)
+
+    global screen, joystick
+    startup = StartupProfiler(STARTUP_NS)
+    startup.mark("imports")
+    screen = init_display()
+    startup.mark("display")
+    joystick = init_joystick()
+    if joystick is None:
         pygame.quit()
         sys.exit()
-except pygame.error as e:
-    print(f"Joystick error: {e}")
-    print("The game requires a joystick to play. Please connect one and restart the game.")
-    pygame.quit()
-    sys.exit()
+    startup.mark("joystick")
+
+    recorder = None
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+        recorder = InputRecorder(joystick)
+    game = Game(screen, recorder or joystick, render_mode=RENDER_MODE, prewarm=None)
+    if args.profile or args.profile_out:
+        game.attach_profiler(args.profile_out)
+    if args.quality == "auto":
+        game.attach_governor(args.frame_budget)
+    else:
+        game.set_quality(QUALITY_TIER_NAMES[args.quality])
+    startup.mark("game")
+
+    def on_first_menu(menu_name):
+        menus.present_hook = None
+        startup.mark("first_menu")
+        # Sprites are rendered while the menu waits for input; started only
+        # now so the thread does not hold the GIL on the way to the menu
+        game.start_prewarm()
+        if args.profile_startup:
+            print(startup.report(args.startup_budget, [("prewarm", None)]))
+    menus.present_hook = on_first_menu
 
-def main():
-    game = Game(screen, joystick)
-    
     while True:
-        menu_result = main_menu(screen, joystick)
+        menu_result = show_menu(args.profile, main_menu, screen, joystick)
         if menu_result == "exit":
             break
         elif menu_result == "start":
-            game.reset()
-            game_result = game_loop(game)
+            start_game(game, recorder, args.record)
+            if args.profile_startup and game.prewarm_thread is not None:
+                game.finish_prewarm()
+                print(f"prewarm finished {game.prewarm_ns / 1e6:.1f} ms after it started")
+            loop = threaded_game_loop if args.threaded else game_loop
+            game_result = loop(game, recorder, args.record, args.fps)
             if game_result == "exit":
                 break
         elif menu_result == "guide":
-            guide_menu(screen, joystick)
+            show_menu(args.profile, guide_menu, screen, joystick)
 
+    if game.profiler is not None:
+        game.profiler.close()
+    if recorder is not None:
+        recorder.close()
     pygame.quit()
     sys.exit()
 
-def game_loop(game):
+def start_game(game, recorder=None, record_dir=None):
+    menus.menu_frames.clear()  # No menu is shown again until gameplay stops
+    game.reset()
+    if recorder is not None:
+        path = os.path.join(record_dir, time.strftime("game-%Y%m%d-%H%M%S.inputlog"))
+        recorder.start(path, game.rng.seed, (game.screen_width, game.screen_height))
+
+def game_loop(game, recorder=None, record_dir=None, fps=0):
     clock = pygame.time.Clock()
-    fixed_time_step = 1 / 60  # 60 FPS for game logic
-    accumulated_time = 0
+    timestep = FixedTimestep(1 / 60, MAX_SUBSTEPS)  # 60 ticks/s for game logic
     running = True
 
     while running:
-        frame_time = clock.tick() / 1000.0  # Time passed since last frame in seconds
-        accumulated_time += frame_time
+        frame_time = clock.tick(fps) / 1000.0  # Time passed since last frame in seconds
+        ticks = timestep.advance(frame_time)
+        frame_start = time.perf_counter_ns()  # Frame work, without the wait in clock.tick
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return "exit"
             elif event.type == pygame.JOYBUTTONDOWN:
                 if event.button == 7:  # Start button
-                    pause_result = pause_menu(screen, joystick)
+                    pause_result = show_menu(game.profiler is not None, pause_menu, screen, joystick)
                     if pause_result == "main_menu" or pause_result == "exit":
                         return pause_result
+                    menus.menu_frames.clear()
+                    game.invalidate_screen()
+                    clock.tick()  # Time spent paused is not simulation time
+                    frame_start = time.perf_counter_ns()
+                elif event.button == PROFILE_OVERLAY_BUTTON and game.profiler is not None:
+                    game.profiler.toggle_overlay()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and game.profiler is not None:
+                game.profiler.toggle_overlay()
 
         # Update game logic at fixed time steps
-        while accumulated_time >= fixed_time_step:
+        for _ in range(ticks):
+            if recorder is not None:
+                recorder.sample()
             game.handle_input()
             game.update_game_state()
-            accumulated_time -= fixed_time_step
+            if recorder is not None:
+                recorder.end_tick(game)
 
-        game.draw_game()
+        # Pump first so the latch sees the stick as it is now, not as of the
+        # event loop above; the events stay queued for the next frame
+        pygame.event.pump()
+        game.latch_input(joystick)
+        game.draw_game(timestep.alpha)  # Presents the frame
+        game.record_frame(time.perf_counter_ns() - frame_start)
 
         if not game.player.alive:
-            pygame.display.flip()
             pygame.time.wait(1000)  # Wait for a second before showing game over menu
-            game_over_result = game_over_menu(screen, joystick, game.score)
+            game_over_result = show_menu(game.profiler is not None, game_over_menu, screen, joystick, game.score)
+            if game.profiler is not None:
+                print(timestep.report())
+                if game.governor is not None:
+                    print(game.governor.report())
             if game_over_result == "continue":
-                game.reset()
+                start_game(game, recorder, record_dir)
+                clock.tick()
             else:
                 return game_over_result
 
-        pygame.display.flip()
+def threaded_game_loop(game, recorder=None, record_dir=None, fps=0):
+    # Same game as game_loop, but ticks run on a SimulationThread and every
+    # frame draws whatever snapshot it published last
+    clock = pygame.time.Clock()
+    sim = SimulationThread(game, recorder, 1 / 60, MAX_SUBSTEPS)
+    sim.start()
+    try:
+        while True:
+            clock.tick(fps)
+            frame_start = time.perf_counter_ns()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return "exit"
+                elif event.type == pygame.JOYBUTTONDOWN:
+                    if event.button == 7:  # Start button
+                        sim.pause()
+                        pause_result = show_menu(game.profiler is not None, pause_menu, screen, joystick)
+                        if pause_result == "main_menu" or pause_result == "exit":
+                            return pause_result
+                        menus.menu_frames.clear()
+                        game.invalidate_screen()
+                        sim.resume()
+                        clock.tick()
+                        frame_start = time.perf_counter_ns()
+                    elif event.button == PROFILE_OVERLAY_BUTTON and game.profiler is not None:
+                        game.profiler.toggle_overlay()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and game.profiler is not None:
+                    game.profiler.toggle_overlay()
+
+            snapshot = sim.snapshots.latest()
+            pygame.event.pump()
+            game.latch_input(joystick)
+            game.draw_game(sim.alpha(snapshot), snapshot)
+            game.record_frame(time.perf_counter_ns() - frame_start)
+
+            if not snapshot.player.alive:
+                sim.pause()  # Already idle, the thread stops ticking once the player dies
+                pygame.time.wait(1000)
+                game_over_result = show_menu(game.profiler is not None, game_over_menu, screen, joystick, game.score)
+                if game.profiler is not None:
+                    print(sim.timestep.report())
+                    print(f"{sim.snapshots.published} snapshots published, {sim.snapshots.dropped} never drawn")
+                    if game.governor is not None:
+                        print(game.governor.report())
+                if game_over_result == "continue":
+                    start_game(game, recorder, record_dir)
+                    sim.resume()
+                    clock.tick()
+                else:
+                    return game_over_result
+    finally:
+        sim.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
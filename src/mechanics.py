@@ -1,9 +1,74 @@
-import random
 import math
+import numpy as np
 import pygame
-from bullet import Bullet
 from powerup import PowerUp
 from colors import Colors
+from fonts import HudText, shared_text
+from patterns import PatternEmitter, boss_schedule
+from proximity import ZONE_INNER, ZONE_OUTER
+
+class GrazeRingBuffer:
+    # Fixed-capacity store of graze arcs. Events are aggregated per angular
+    # bucket and zone: a bucket that is already showing an arc gets refreshed
+    # instead of stacking a new one, and the oldest entries are overwritten
+    # once the buffer is full.
+    ZONES = ('red', 'blue')
+
+    def __init__(self, fade_time, buckets=32, capacity=128):
+        self.fade_time = fade_time
+        self.buckets = buckets
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.bucket = np.zeros(capacity, dtype=np.int16)
+        self.zone = np.zeros(capacity, dtype=np.int8)
+        self.born = np.full(capacity, -fade_time, dtype=np.int64)
+        self.latest = np.full((len(self.ZONES), buckets), -1, dtype=np.int64)
+        self.head = 0
+        self.tick = 0
+
+    def advance(self):
+        self.tick += 1
+
+    def add(self, x, y, angles, zone):
+        if len(angles) == 0:
+            return
+        zone = self.ZONES.index(zone)
+        buckets = np.unique((((angles + math.pi) / (2 * math.pi)) * self.buckets).astype(np.int64) % self.buckets)
+
+        # Refresh arcs still held for this (zone, bucket), append the rest
+        slots = self.latest[zone, buckets]
+        held = (slots >= 0) & (self.bucket[slots] == buckets) & (self.zone[slots] == zone)
+        refreshed = slots[held]
+        self.x[refreshed] = x
+        self.y[refreshed] = y
+        self.born[refreshed] = self.tick
+
+        new_buckets = buckets[~held]
+        rows = (self.head + np.arange(len(new_buckets))) % self.capacity
+        self.x[rows] = x
+        self.y[rows] = y
+        self.bucket[rows] = new_buckets
+        self.zone[rows] = zone
+        self.born[rows] = self.tick
+        self.latest[zone, new_buckets] = rows
+        self.head = (self.head + len(new_buckets)) % self.capacity
+
+    def copy_from(self, other):
+        for mine, theirs in ((self.x, other.x), (self.y, other.y), (self.bucket, other.bucket),
+                             (self.zone, other.zone), (self.born, other.born)):
+            np.copyto(mine, theirs)
+        self.head = other.head
+        self.tick = other.tick
+
+    def live(self):
+        # Rows whose arc is still fading, with the frames left on each
+        remaining = self.fade_time - (self.tick - self.born)
+        rows = np.flatnonzero(remaining > 0)
+        return rows, remaining[rows]
+
+    def bucket_angle(self, bucket):
+        return (bucket + 0.5) * (2 * math.pi / self.buckets) - math.pi
 
 class GrazingSystem:
     def __init__(self):
@@ -12,78 +77,96 @@ class GrazingSystem:
         self.max_meter = 100
         self.outer_graze_distance = 60
         self.inner_graze_distance = 30
-        self.font = pygame.font.Font(None, 24)
-        self.graze_rings = []
+        self.level_text = HudText(shared_text, 24, Colors.FOREGROUND, "Graze Level: {}", lambda: self.level)
         self.ring_fade_time = 30
-
-    def update(self, player, enemy_bullets, enemies):
-        self.update_graze_rings()
-        for bullet in enemy_bullets:
-            self.check_graze(player, bullet)
-        for enemy in enemies:
-            self.check_graze(player, enemy)
-
-    def check_graze(self, player, entity):
-        distance = math.hypot(entity.x - player.x, entity.y - player.y)
-        if player.hitbox_size < distance <= self.outer_graze_distance:
-            if distance <= self.inner_graze_distance:
-                self.add_meter(2)  # Fast fill for red zone
-                self.add_graze_ring(player, entity, 'red')
-            else:
-                self.add_meter(0.5)  # Slower fill for blue zone
-                self.add_graze_ring(player, entity, 'blue')
+        self.graze_rings = GrazeRingBuffer(self.ring_fade_time)
+
+    def copy_from(self, other):
+        # What draw and draw_graze_zones read, for a render snapshot
+        self.meter = other.meter
+        self.level = other.level
+        self.max_meter = other.max_meter
+        self.outer_graze_distance = other.outer_graze_distance
+        self.inner_graze_distance = other.inner_graze_distance
+        self.ring_fade_time = other.ring_fade_time
+        self.graze_rings.copy_from(other.graze_rings)
+
+    def update(self, player, proximity):
+        # Grazes come from the PlayerProximity pass the collision step took this tick
+        self.graze_rings.advance()
+        rows = proximity.graze_rows()
+        zone = proximity.zone[rows]
+        dx = proximity.dx[rows]
+        dy = proximity.dy[rows]
+        inner = zone == ZONE_INNER
+        outer = zone == ZONE_OUTER
+
+        inner_count = int(np.count_nonzero(inner))
+        outer_count = int(np.count_nonzero(outer))
+        if inner_count == 0 and outer_count == 0:
+            return 0
+        self.graze_rings.add(player.x, player.y, np.arctan2(dy[inner], dx[inner]), 'red')
+        self.graze_rings.add(player.x, player.y, np.arctan2(dy[outer], dx[outer]), 'blue')
+        # Fast fill for the red zone, slower fill for the blue zone
+        return self.add_meter(2 * inner_count + 0.5 * outer_count)
 
     def add_meter(self, amount):
+        # Returns the number of levels gained; a gain past a full meter
+        # carries into the next level instead of being dropped
         self.meter += amount
-        if self.meter >= self.max_meter:
+        levels = 0
+        while self.max_meter > 0 and self.meter >= self.max_meter:
+            self.meter -= self.max_meter
             self.level_up()
-            return True
-        return False
+            levels += 1
+        return levels
 
     def level_up(self):
         self.level += 1
-        self.meter = 0
         return True
 
-    def add_graze_ring(self, player, entity, zone):
-        angle = math.atan2(entity.y - player.y, entity.x - player.x)
-        self.graze_rings.append({
-            'x': player.x,
-            'y': player.y,
-            'angle': angle,
-            'zone': zone,
-            'time': self.ring_fade_time
-        })
-
-    def update_graze_rings(self):
-        for ring in self.graze_rings[:]:
-            ring['time'] -= 1
-            if ring['time'] <= 0:
-                self.graze_rings.remove(ring)
-
     def draw(self, screen, screen_width):
         # Draw graze meter
         meter_width = 200
         meter_height = 20
         x = screen_width - meter_width - 10
         y = 10
-        pygame.draw.rect(screen, Colors.COMMENT, (x, y, meter_width, meter_height))
+        meter_rect = pygame.draw.rect(screen, Colors.COMMENT, (x, y, meter_width, meter_height))
         fill_width = int(self.meter / self.max_meter * meter_width)
         pygame.draw.rect(screen, Colors.PURPLE, (x, y, fill_width, meter_height))
         
         # Draw graze level
-        level_text = self.font.render(f"Graze Level: {self.level}", True, Colors.FOREGROUND)
-        screen.blit(level_text, (x - level_text.get_width() - 10, y + 5))
-
-    def draw_graze_zones(self, screen, player):
-        for ring in self.graze_rings:
-            color = Colors.GRAZE_INNER_COLOR if ring['zone'] == 'red' else Colors.GRAZE_OUTER_COLOR
-            alpha = int(255 * (ring['time'] / self.ring_fade_time))
-            surface = pygame.Surface((self.outer_graze_distance * 2, self.outer_graze_distance * 2), pygame.SRCALPHA)
-            pygame.draw.arc(surface, (*color, alpha),
-                            (0, 0, self.outer_graze_distance * 2, self.outer_graze_distance * 2),
-                            ring['angle'] - 0.3, ring['angle'] + 0.3, 3)
-            screen.blit(surface, (ring['x'] - self.outer_graze_distance, ring['y'] - self.outer_graze_distance))
+        level_text = self.level_text.surface()
+        return [meter_rect, screen.blit(level_text, (x - level_text.get_width() - 10, y + 5))]
+
+    def draw_graze_zones(self, screen, player, effects, merged=False):
+        rings = self.graze_rings
+        rows, remaining = rings.live()
+        if merged:
+            return self.draw_merged_graze_zones(screen, effects, rows, remaining)
+        drawn = []
+        for row, time_left in zip(rows.tolist(), remaining.tolist()):
+            color = Colors.GRAZE_INNER_COLOR if rings.zone[row] == 0 else Colors.GRAZE_OUTER_COLOR
+            alpha = int(255 * (time_left / self.ring_fade_time))
+            arc, (ox, oy) = effects.arc(color, self.outer_graze_distance, rings.bucket_angle(rings.bucket[row]), alpha)
+            drawn.append(screen.blit(arc, (rings.x[row] + ox, rings.y[row] + oy)))
+        return drawn
+
+    def draw_merged_graze_zones(self, screen, effects, rows, remaining):
+        # One ring per zone where the freshest arc was, instead of one arc per bucket
+        rings = self.graze_rings
+        drawn = []
+        zones = rings.zone[rows]
+        for zone, color, radius in ((0, Colors.GRAZE_INNER_COLOR, self.inner_graze_distance),
+                                    (1, Colors.GRAZE_OUTER_COLOR, self.outer_graze_distance)):
+            in_zone = np.flatnonzero(zones == zone)
+            if len(in_zone) == 0:
+                continue
+            freshest = in_zone[np.argmax(remaining[in_zone])]
+            row = rows[freshest]
+            ring, (ox, oy) = effects.ring(color, radius, int(255 * (remaining[freshest] / self.ring_fade_time)))
+            drawn.append(screen.blit(ring, (rings.x[row] + ox, rings.y[row] + oy)))
+        return drawn
 
 class PowerUpSystem:
     def __init__(self, game):
@@ -105,14 +188,15 @@ class PowerUpSystem:
 
     def spawn_powerups(self):
         if self.wave_number >= 2 and self.wave_number % 2 == 0 and len(self.powerups) < self.max_powerups:
-            if random.random() < 0.1:
-                x = random.randint(50, self.game.screen_width - 50)
-                y = random.randint(50, self.game.screen_height - 50)
+            rng = self.game.rng.powerups
+            if rng.random() < 0.1:
+                x = rng.randint(50, self.game.screen_width - 50)
+                y = rng.randint(50, self.game.screen_height - 50)
             
                 if not self.available_powerups:
                     self.available_powerups = ["spread", "laser", "homing", "multishot", "shield", "bomb"]
             
-                powerup_type = random.choice(self.available_powerups)
+                powerup_type = rng.choice(self.available_powerups)
                 self.powerups.append(PowerUp(x, y, powerup_type))
                 self.available_powerups.remove(powerup_type)
 
@@ -131,152 +215,166 @@ class PowerUpSystem:
                 player.current_weapon = "default"
                 
 class EnemyBehavior:
-    def __init__(self):
+    def __init__(self, streams):
+        self.streams = streams  # RandomStreams: enemies for single rolls, enemy_ai for the kernels
+        self.random = streams.enemies
         self.base_enemy_fire_rate = 60
         self.difficulty_multiplier = 1.0
+        # Difficulty starts at base_difficulty and rises by difficulty_step every 1000 points
+        self.base_difficulty = 1.0
+        self.difficulty_step = 0.1
+        self.max_difficulty = 2.0
+        self.clock_ms = 0  # Simulation time, set by the game every tick
+        self.boss_schedule = boss_schedule
+        self.boss_bullet_budget = 240  # Bullets per second per boss
+        self.boss_schedules = {}  # Pattern tables per difficulty step
+        self.boss_emitters = {}
+        self.kernels = {
+            "normal": self.normal_kernel,
+            "fast": self.fast_kernel,
+            "tough": self.tough_kernel,
+            "flanker": self.flanker_kernel,
+            "zigzag": self.zigzag_kernel,
+            "boss": self.boss_kernel,
+        }
 
     def update_difficulty(self, score):
         # Increase difficulty based on score
-        self.difficulty_multiplier = 1.0 + (score // 1000) * 0.1
-        # Cap the difficulty multiplier at 2.0
-        self.difficulty_multiplier = min(self.difficulty_multiplier, 2.0)
-
-    def update(self, enemy, player, enemy_bullets, score):
+        self.difficulty_multiplier = self.base_difficulty + (score // 1000) * self.difficulty_step
+        # Cap the difficulty multiplier
+        self.difficulty_multiplier = min(self.difficulty_multiplier, self.max_difficulty)
+
+    def update_all(self, enemies, player, enemy_bullets, score):
+        # Enemies are grouped by archetype, each group's positions are
+        # gathered into arrays for one kernel call that moves them and rolls
+        # their fire, and every shot of the tick is spawned with a single
+        # spawn_many. Waves of any size take this path, so a wave plays the
+        # same whatever its enemy count and every roll comes from enemy_ai.
         self.update_difficulty(score)
-        
-        if enemy.type == "normal":
-            self.normal_enemy_behavior(enemy, player, enemy_bullets)
-        elif enemy.type == "fast":
-            self.fast_enemy_behavior(enemy, player, enemy_bullets)
-        elif enemy.type == "tough":
-            self.tough_enemy_behavior(enemy, player, enemy_bullets)
-        elif enemy.type == "flanker":
-            self.flanker_behavior(enemy, player, enemy_bullets)
-        elif enemy.type == "zigzag":
-            self.zigzag_behavior(enemy, player, enemy_bullets)
-        elif enemy.type == "boss":
-            self.boss_behavior(enemy, player, enemy_bullets)
-
-        # Keep enemies within screen bounds
-        enemy.x = max(enemy.size, min(player.screen_width - enemy.size, enemy.x))
-        enemy.y = max(enemy.size, min(player.screen_height - enemy.size, enemy.y))
-
-    def normal_enemy_behavior(self, enemy, player, enemy_bullets):
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        dist = math.hypot(dx, dy)
-        if dist != 0:
-            speed = 2 * self.difficulty_multiplier
-            enemy.x += dx / dist * speed
-            enemy.y += dy / dist * speed
-
-        if random.randint(1, int(self.base_enemy_fire_rate / self.difficulty_multiplier)) == 1:
-            self.enemy_shoot(enemy, player, enemy_bullets)
-
-    def fast_enemy_behavior(self, enemy, player, enemy_bullets):
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        dist = math.hypot(dx, dy)
-        if dist != 0:
-            speed = 3 * self.difficulty_multiplier
-            enemy.x += dx / dist * speed + random.uniform(-1, 1)
-            enemy.y += dy / dist * speed + random.uniform(-1, 1)
-
-        if random.randint(1, int(self.base_enemy_fire_rate / 2 / self.difficulty_multiplier)) == 1:
-            self.enemy_shoot(enemy, player, enemy_bullets)
-
-    def tough_enemy_behavior(self, enemy, player, enemy_bullets):
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        dist = math.hypot(dx, dy)
-        if dist != 0:
-            speed = 1.5 * self.difficulty_multiplier
-            enemy.x += dx / dist * speed
-            enemy.y += dy / dist * speed
-
-        if random.randint(1, int(self.base_enemy_fire_rate / self.difficulty_multiplier)) == 1:
-            angle = math.atan2(dy, dx)
-            spread = 3 + int(self.difficulty_multiplier)
-            for i in range(-spread // 2, spread // 2 + 1):
-                self.enemy_shoot(enemy, player, enemy_bullets, angle + i * 0.2)
-
-    def flanker_behavior(self, enemy, player, enemy_bullets):
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        dist = math.hypot(dx, dy)
-        
-        if dist > 200:
-            # Approach the player from the sides
-            speed = 2 * self.difficulty_multiplier
-            angle = math.atan2(dy, dx) + math.pi / 2  # Perpendicular to the player's direction
-            enemy.x += math.cos(angle) * speed
-            enemy.y += math.sin(angle) * speed
-        else:
-            # Circle around the player
-            speed = 2 * self.difficulty_multiplier
-            angle = math.atan2(dy, dx)
-            enemy.x += math.cos(angle + math.pi / 2) * speed
-            enemy.y += math.sin(angle + math.pi / 2) * speed
-
-        if random.randint(1, int(self.base_enemy_fire_rate / self.difficulty_multiplier)) == 1:
-            self.enemy_shoot(enemy, player, enemy_bullets)
-
-    def zigzag_behavior(self, enemy, player, enemy_bullets):
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        dist = math.hypot(dx, dy)
-
-        if dist != 0:
-            speed = 2 * self.difficulty_multiplier
-            angle = math.atan2(dy, dx)
-            enemy.x += math.cos(angle) * speed
-            enemy.y += math.sin(angle) * speed
-
-            # Zigzag movement
-            enemy.x += math.cos(enemy.y / 30) * speed
-            enemy.y += math.sin(enemy.x / 30) * speed
-
-        if random.randint(1, int(self.base_enemy_fire_rate / self.difficulty_multiplier)) == 1:
-            self.enemy_shoot(enemy, player, enemy_bullets)
-
-    def boss_behavior(self, enemy, player, enemy_bullets):
-        enemy.x = 400 + math.sin(pygame.time.get_ticks() * 0.001 * self.difficulty_multiplier) * 200
-        enemy.y = min(enemy.y + 0.5 * self.difficulty_multiplier, 150)
-
-        time = pygame.time.get_ticks() * 0.001
-        if int(time * 2 * self.difficulty_multiplier) % 2 == 0:
-            self.boss_spiral_shot(enemy, enemy_bullets)
+        groups = {}
+        for enemy in enemies:
+            groups.setdefault(enemy.type, []).append(enemy)
+
+        shots = []
+        for enemy_type, group in groups.items():
+            n = len(group)
+            xs = np.fromiter([enemy.x for enemy in group], np.float64, n)
+            ys = np.fromiter([enemy.y for enemy in group], np.float64, n)
+            self.kernels[enemy_type](xs, ys, player, shots)
+
+            # Keep enemies within screen bounds
+            size = group[0].size
+            np.minimum(np.maximum(xs, size, out=xs), player.screen_width - size, out=xs)
+            np.minimum(np.maximum(ys, size, out=ys), player.screen_height - size, out=ys)
+            for enemy, x, y in zip(group, xs.tolist(), ys.tolist()):
+                enemy.x = x
+                enemy.y = y
+
+        if shots:
+            shot_x, shot_y, angles = (np.concatenate(column) for column in zip(*shots))
+            enemy_bullets.spawn_many(shot_x, shot_y, angles, speed=5 * self.difficulty_multiplier)
+        self.fire_bosses(groups.get("boss", []), player, enemy_bullets)
+
+    def fire_bosses(self, bosses, player, enemy_bullets):
+        for boss in bosses:
+            self.fire_boss(boss, player, enemy_bullets)
+        if len(self.boss_emitters) > len(bosses):
+            # Forget the pattern state of bosses that are gone
+            self.boss_emitters = {boss: self.boss_emitters[boss] for boss in bosses}
+
+    def fire_boss(self, boss, player, enemy_bullets):
+        # Bosses fire from where they end up after clamping, on the pattern
+        # schedule instead of every tick
+        difficulty = self.difficulty_multiplier
+        schedule = self.boss_schedules.get(difficulty)
+        if schedule is None:
+            schedule = self.boss_schedules[difficulty] = self.boss_schedule(difficulty)
+        emitter = self.boss_emitters.get(boss)
+        if emitter is None:
+            emitter = self.boss_emitters[boss] = PatternEmitter(self.boss_bullet_budget)
+        aim = math.atan2(player.y - boss.y, player.x - boss.x)
+        emitter.fire(schedule, boss.x, boss.y, aim, 5 * difficulty, enemy_bullets)
+
+    def chase(self, xs, ys, player, speed):
+        dx = player.x - xs
+        dy = player.y - ys
+        dist = np.hypot(dx, dy)
+        moving = dist != 0
+        if moving.all():
+            step = speed / dist
         else:
-            self.boss_aimed_shot(enemy, player, enemy_bullets)
-
-    def boss_spiral_shot(self, enemy, enemy_bullets):
-        num_bullets = int(8 * self.difficulty_multiplier)
-        for i in range(num_bullets):
-            angle = (pygame.time.get_ticks() * 0.01 * self.difficulty_multiplier + i * (2 * math.pi / num_bullets)) % (2 * math.pi)
-            self.enemy_shoot(enemy, None, enemy_bullets, angle)
-
-    def boss_aimed_shot(self, enemy, player, enemy_bullets):
-        dx = player.x - enemy.x
-        dy = player.y - enemy.y
-        angle = math.atan2(dy, dx)
-        spread = 5 + int(self.difficulty_multiplier)
-        for i in range(-spread // 2, spread // 2 + 1):
-            self.enemy_shoot(enemy, None, enemy_bullets, angle + i * 0.2)
-
-    def enemy_shoot(self, enemy, player, enemy_bullets, angle=None):
-        if angle is None:
-            dx = player.x - enemy.x
-            dy = player.y - enemy.y
-            angle = math.atan2(dy, dx)
-        bullet_speed = 5 * self.difficulty_multiplier
-        enemy_bullets.append(Bullet(enemy.x, enemy.y, angle, friendly=False, speed=bullet_speed))
-
-    def get_enemy_type(self, graze_level):
+            step = np.divide(speed, dist, out=np.zeros_like(dist), where=moving)
+        xs += dx * step
+        ys += dy * step
+        return dx, dy, moving
+
+    def fire_rolls(self, n, rate):
+        # Same odds as randint(1, int(rate)) == 1 per enemy
+        return self.streams.enemy_ai.random(n) * int(rate) < 1
+
+    def aimed_shots(self, xs, ys, player, firing, shots):
+        if firing.any():
+            fx = xs[firing]
+            fy = ys[firing]
+            shots.append((fx, fy, np.arctan2(player.y - fy, player.x - fx)))
+
+    def fan_shots(self, xs, ys, angles, spread, shots):
+        # Each shooter fires a fan of bullets 0.2 rad apart around its angle
+        offsets = np.arange(-spread // 2, spread // 2 + 1) * 0.2
+        k = len(offsets)
+        shots.append((np.repeat(xs, k), np.repeat(ys, k), (angles[:, None] + offsets).ravel()))
+
+    def normal_kernel(self, xs, ys, player, shots):
+        self.chase(xs, ys, player, 2 * self.difficulty_multiplier)
+        firing = self.fire_rolls(len(xs), self.base_enemy_fire_rate / self.difficulty_multiplier)
+        self.aimed_shots(xs, ys, player, firing, shots)
+
+    def fast_kernel(self, xs, ys, player, shots):
+        _, _, moving = self.chase(xs, ys, player, 3 * self.difficulty_multiplier)
+        jitter = self.streams.enemy_ai.uniform(-1, 1, (2, len(xs)))
+        xs += jitter[0] * moving
+        ys += jitter[1] * moving
+        firing = self.fire_rolls(len(xs), self.base_enemy_fire_rate / 2 / self.difficulty_multiplier)
+        self.aimed_shots(xs, ys, player, firing, shots)
+
+    def tough_kernel(self, xs, ys, player, shots):
+        dx, dy, _ = self.chase(xs, ys, player, 1.5 * self.difficulty_multiplier)
+        firing = self.fire_rolls(len(xs), self.base_enemy_fire_rate / self.difficulty_multiplier)
+        if firing.any():
+            spread = 3 + int(self.difficulty_multiplier)
+            self.fan_shots(xs[firing], ys[firing], np.arctan2(dy[firing], dx[firing]), spread, shots)
+
+    def flanker_kernel(self, xs, ys, player, shots):
+        # Far away they approach from the side and close in they circle the
+        # player; either way they move perpendicular to the player's direction
+        speed = 2 * self.difficulty_multiplier
+        angles = np.arctan2(player.y - ys, player.x - xs) + math.pi / 2
+        xs += np.cos(angles) * speed
+        ys += np.sin(angles) * speed
+        firing = self.fire_rolls(len(xs), self.base_enemy_fire_rate / self.difficulty_multiplier)
+        self.aimed_shots(xs, ys, player, firing, shots)
+
+    def zigzag_kernel(self, xs, ys, player, shots):
+        speed = 2 * self.difficulty_multiplier
+        _, _, moving = self.chase(xs, ys, player, speed)
+        rows = np.flatnonzero(moving)
+        xs[rows] += np.cos(ys[rows] / 30) * speed
+        ys[rows] += np.sin(xs[rows] / 30) * speed
+        firing = self.fire_rolls(len(xs), self.base_enemy_fire_rate / self.difficulty_multiplier)
+        self.aimed_shots(xs, ys, player, firing, shots)
+
+    def boss_kernel(self, xs, ys, player, shots):
+        # Movement only, bosses fire through their pattern emitters
+        xs[:] = 400 + math.sin(self.clock_ms * 0.001 * self.difficulty_multiplier) * 200
+        np.minimum(ys + 0.5 * self.difficulty_multiplier, 150, out=ys)
+
+    def get_enemy_type(self, graze_level, rng=None):
+        rng = self.random if rng is None else rng
         if graze_level < 3:
-            return random.choice(["normal", "fast", "flanker", "zigzag"])
+            return rng.choice(["normal", "fast", "flanker", "zigzag"])
         elif graze_level < 6:
-            return random.choice(["normal", "fast", "tough", "flanker", "zigzag"])
+            return rng.choice(["normal", "fast", "tough", "flanker", "zigzag"])
         else:
             choices = ["normal", "fast", "tough", "flanker", "zigzag"]
             weights = [1, 1 + self.difficulty_multiplier * 0.5, self.difficulty_multiplier - 1, 1, 1]
-            return random.choices(choices, weights=weights)[0]
\ No newline at end of file
+            return rng.choices(choices, weights=weights)[0]
\ No newline at end of file
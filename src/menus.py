@@ -1,66 +1,187 @@
+import time
 import pygame
 from colors import Colors
+from fonts import shared_text
 
 # Menu settings
 MENU_FONT_SIZE = 36
 MENU_ITEM_HEIGHT = 50
-MENU_FPS = 30
 MENU_INPUT_DELAY = 200
+MENU_AXIS_THRESHOLD = 0.5
 
-def draw_menu(screen, menu_items, selected_index):
-    menu_font = pygame.font.Font(None, MENU_FONT_SIZE)
-    title_font = pygame.font.Font(None, MENU_FONT_SIZE * 2)
+class MenuStats:
+    # Proof that idle menus cost nothing: time blocked in event.wait versus
+    # time awake, how often the loop woke up and how many frames it presented.
+    def __init__(self):
+        self.reset()
 
+    def reset(self):
+        self.wakeups = 0
+        self.frames = 0
+        self.idle_ns = 0
+        self.busy_ns = 0
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    def report(self):
+        wall = time.perf_counter() - self.wall_start
+        return {
+            "wakeups": self.wakeups,
+            "frames": self.frames,
+            "idle_s": self.idle_ns / 1e9,
+            "busy_s": self.busy_ns / 1e9,
+            "cpu_percent": 100 * (time.process_time() - self.cpu_start) / wall if wall > 0 else 0.0,
+        }
+
+    def summary(self, name):
+        report = self.report()
+        awake = report["idle_s"] + report["busy_s"]
+        busy = 100 * report["busy_s"] / awake if awake else 0.0
+        return (f"{name} menu: {report['frames']} frames over {report['wakeups']} wakeups, "
+                f"{report['idle_s']:.1f}s waiting, {report['busy_s'] * 1000:.1f} ms awake ({busy:.2f}% busy), "
+                f"{report['cpu_percent']:.1f}% CPU")
+
+menu_stats = MenuStats()
+present_hook = None  # Optional callable(menu_name), run after a menu frame is presented
+
+def now_ms():
+    # pygame.time.get_ticks stays at 0 unless pygame.init() ran, and main only
+    # initialises the subsystems it uses
+    return time.monotonic_ns() // 1_000_000
+
+class MenuFrameCache:
+    # The current menu's static layer, composed once with no item
+    # highlighted, so moving the selection is one blit of the layer and the
+    # highlighted item drawn over it. Only one menu's layer is held at a
+    # time, and clear() frees it when gameplay starts.
+    def __init__(self):
+        self.key = None
+        self.layer = None
+
+    def present(self, screen, key, render, highlight=None):
+        start = time.perf_counter_ns()
+        key = (screen.get_size(), key)
+        if key != self.key:
+            render(screen)
+            self.layer = screen.copy()
+            self.key = key
+        else:
+            screen.blit(self.layer, (0, 0))
+        if highlight is not None:
+            highlight(screen)
+        pygame.display.flip()
+        menu_stats.frames += 1
+        menu_stats.busy_ns += time.perf_counter_ns() - start
+
+    def clear(self):
+        self.key = None
+        self.layer = None
+
+menu_frames = MenuFrameCache()
+
+def wait_for_events(timeout):
+    # Block until something happens (or the stick repeat timer is due)
+    start = time.perf_counter_ns()
+    first = pygame.event.wait(timeout) if timeout else pygame.event.wait()
+    woke = time.perf_counter_ns()
+    menu_stats.idle_ns += woke - start
+    menu_stats.wakeups += 1
+    return [first] + pygame.event.get(), woke
+
+def finish_wakeup(woke):
+    menu_stats.busy_ns += time.perf_counter_ns() - woke
+
+def menu_item_position(screen, text, index):
+    return (screen.get_width() // 2 - text.get_width() // 2, screen.get_height() // 2 + index * MENU_ITEM_HEIGHT)
+
+def draw_menu(screen, menu_items, selected_index=None):
     screen.fill(Colors.BACKGROUND)
-    title = title_font.render("Twin Stick Shooter", True, Colors.FOREGROUND)
+    title = shared_text.render(MENU_FONT_SIZE * 2, "Twin Stick Shooter", Colors.FOREGROUND)
     screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, screen.get_height() // 4))
 
     for i, item in enumerate(menu_items):
         color = Colors.GREEN if i == selected_index else Colors.COMMENT
-        text = menu_font.render(item, True, color)
-        x = screen.get_width() // 2 - text.get_width() // 2
-        y = screen.get_height() // 2 + i * MENU_ITEM_HEIGHT
-        screen.blit(text, (x, y))
+        text = shared_text.render(MENU_FONT_SIZE, item, color)
+        screen.blit(text, menu_item_position(screen, text, i))
 
-def main_menu(screen, joystick):
-    menu_items = ["Start Game", "How to Play", "Exit"]
-    selected_index = 0
-    clock = pygame.time.Clock()
-    last_input_time = pygame.time.get_ticks()
+def highlight_menu_item(screen, menu_items, selected_index):
+    # Repaints one item of a layer drawn by draw_menu with nothing selected
+    text = shared_text.render(MENU_FONT_SIZE, menu_items[selected_index], Colors.GREEN)
+    rect = text.get_rect(topleft=menu_item_position(screen, text, selected_index))
+    screen.fill(Colors.BACKGROUND, rect)
+    screen.blit(text, rect)
+
+def run_menu(screen, joystick, name, menu_items, on_button, render=None, frame_key=None, selected_index=0):
+    # Shared event-driven loop: sleeps in event.wait, moves the selection on
+    # stick events (repeating every MENU_INPUT_DELAY while held) and only
+    # re-presents when the selection changes or the window needs repainting.
+    render = render or (lambda surface, index: draw_menu(surface, menu_items, index))
+    axis_value = joystick.get_axis(1)  # Left stick vertical
+    next_repeat = now_ms() + MENU_INPUT_DELAY
+    dirty = True
 
     while True:
-        current_time = pygame.time.get_ticks()
-        
-        for event in pygame.event.get():
+        if dirty:
+            menu_frames.present(screen, (name, frame_key), lambda surface: render(surface, None),
+                                lambda surface: highlight_menu_item(surface, menu_items, selected_index))
+            dirty = False
+            if present_hook is not None:
+                present_hook(name)
+
+        stick_held = abs(axis_value) > MENU_AXIS_THRESHOLD
+        if stick_held:
+            timeout = max(1, next_repeat - now_ms())
+        else:
+            timeout = 0
+        events, woke = wait_for_events(timeout)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return "exit"
             elif event.type == pygame.JOYBUTTONDOWN:
-                if event.button == 0:  # A button
-                    if selected_index == 0:
-                        return "start"
-                    elif selected_index == 1:
-                        guide_menu(screen, joystick)
-                    elif selected_index == 2:
-                        return "exit"
-
-        if current_time - last_input_time > MENU_INPUT_DELAY:
-            axis_value = joystick.get_axis(1)  # Left stick vertical
-            if axis_value < -0.5 and selected_index > 0:
+                result = on_button(event.button, selected_index)
+                if result is not None:
+                    return result
+            elif event.type == pygame.JOYAXISMOTION and event.axis == 1:
+                axis_value = event.value
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                dirty = True
+
+        current_time = now_ms()
+        if abs(axis_value) > MENU_AXIS_THRESHOLD and current_time >= next_repeat:
+            if axis_value < 0 and selected_index > 0:
                 selected_index -= 1
-                last_input_time = current_time
-            elif axis_value > 0.5 and selected_index < len(menu_items) - 1:
+                dirty = True
+            elif axis_value > 0 and selected_index < len(menu_items) - 1:
                 selected_index += 1
-                last_input_time = current_time
+                dirty = True
+            next_repeat = current_time + MENU_INPUT_DELAY
+        elif abs(axis_value) <= MENU_AXIS_THRESHOLD:
+            next_repeat = 0
 
-        draw_menu(screen, menu_items, selected_index)
-        pygame.display.flip()
-        clock.tick(MENU_FPS)
+        finish_wakeup(woke)
 
-def guide_menu(screen, joystick):
-    guide_font = pygame.font.Font(None, 24)
-    title_font = pygame.font.Font(None, 36)
-    clock = pygame.time.Clock()
+def main_menu(screen, joystick):
+    menu_items = ["Start Game", "How to Play", "Exit"]
+
+    def on_button(button, selected_index):
+        if button == 0:  # A button
+            if selected_index == 0:
+                return "start"
+            elif selected_index == 1:
+                return "guide"
+            elif selected_index == 2:
+                return "exit"
+
+    selected_index = 0
+    while True:
+        result = run_menu(screen, joystick, "main", menu_items, on_button, selected_index=selected_index)
+        if result != "guide":
+            return result
+        guide_menu(screen, joystick)
+        selected_index = 1
 
+def draw_guide(screen):
     guide_text = [
         "How to Play:",
         "",
@@ -80,97 +201,66 @@ def guide_menu(screen, joystick):
         "Press A to return to main menu"
     ]
 
+    screen.fill(Colors.BACKGROUND)
+    title = shared_text.render(36, "Game Guide", Colors.FOREGROUND)
+    screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 20))
+
+    for i, line in enumerate(guide_text):
+        text = shared_text.render(24, line, Colors.FOREGROUND)
+        screen.blit(text, (50, 80 + i * 30))
+
+def guide_menu(screen, joystick):
+    dirty = True
     while True:
-        for event in pygame.event.get():
+        if dirty:
+            menu_frames.present(screen, ("guide",), draw_guide)
+            dirty = False
+
+        events, woke = wait_for_events(0)
+        for event in events:
             if event.type == pygame.QUIT:
                 return "exit"
             elif event.type == pygame.JOYBUTTONDOWN:
                 if event.button == 0:  # A button
                     return
-
-        screen.fill(Colors.BACKGROUND)
-        title = title_font.render("Game Guide", True, Colors.FOREGROUND)
-        screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 20))
-
-        for i, line in enumerate(guide_text):
-            text = guide_font.render(line, True, Colors.FOREGROUND)
-            screen.blit(text, (50, 80 + i * 30))
-
-        pygame.display.flip()
-        clock.tick(MENU_FPS)
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                dirty = True
+        finish_wakeup(woke)
 
 def pause_menu(screen, joystick):
     menu_items = ["Resume", "Exit to Main Menu"]
-    selected_index = 0
-    clock = pygame.time.Clock()
-    last_input_time = pygame.time.get_ticks()
 
-    while True:
-        current_time = pygame.time.get_ticks()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "exit"
-            elif event.type == pygame.JOYBUTTONDOWN:
-                if event.button == 0:  # A button
-                    if selected_index == 0:
-                        return "resume"
-                    elif selected_index == 1:
-                        return "main_menu"
-                elif event.button == 7:  # Start button
-                    return "resume"
-
-        if current_time - last_input_time > MENU_INPUT_DELAY:
-            axis_value = joystick.get_axis(1)  # Left stick vertical
-            if axis_value < -0.5 and selected_index > 0:
-                selected_index -= 1
-                last_input_time = current_time
-            elif axis_value > 0.5 and selected_index < len(menu_items) - 1:
-                selected_index += 1
-                last_input_time = current_time
+    def on_button(button, selected_index):
+        if button == 0:  # A button
+            if selected_index == 0:
+                return "resume"
+            elif selected_index == 1:
+                return "main_menu"
+        elif button == 7:  # Start button
+            return "resume"
 
-        draw_menu(screen, menu_items, selected_index)
-        pygame.display.flip()
-        clock.tick(MENU_FPS)
+    return run_menu(screen, joystick, "pause", menu_items, on_button)
 
 def game_over_menu(screen, joystick, score):
-    menu_font = pygame.font.Font(None, MENU_FONT_SIZE)
     menu_items = ["Continue", "Exit to Main Menu"]
-    selected_index = 0
-    clock = pygame.time.Clock()
-    last_input_time = pygame.time.get_ticks()
 
-    while True:
-        current_time = pygame.time.get_ticks()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "exit"
-            elif event.type == pygame.JOYBUTTONDOWN:
-                if event.button == 0:  # A button
-                    if selected_index == 0:
-                        return "continue"
-                    elif selected_index == 1:
-                        return "main_menu"
-
-        if current_time - last_input_time > MENU_INPUT_DELAY:
-            axis_value = joystick.get_axis(1)  # Left stick vertical
-            if axis_value < -0.5 and selected_index > 0:
-                selected_index -= 1
-                last_input_time = current_time
-            elif axis_value > 0.5 and selected_index < len(menu_items) - 1:
-                selected_index += 1
-                last_input_time = current_time
+    def on_button(button, selected_index):
+        if button == 0:  # A button
+            if selected_index == 0:
+                return "continue"
+            elif selected_index == 1:
+                return "main_menu"
 
+    def render(screen, selected_index):
         screen.fill(Colors.BACKGROUND)
-        game_over_text = menu_font.render("GAME OVER", True, Colors.RED)
-        screen.blit(game_over_text, (screen.get_width() // 2 - game_over_text.get_width() // 2, 
+        game_over_text = shared_text.render(MENU_FONT_SIZE, "GAME OVER", Colors.RED)
+        screen.blit(game_over_text, (screen.get_width() // 2 - game_over_text.get_width() // 2,
                                      screen.get_height() // 3 - game_over_text.get_height() // 2))
-        
-        score_text = menu_font.render(f"Final Score: {score}", True, Colors.FOREGROUND)
-        screen.blit(score_text, (screen.get_width() // 2 - score_text.get_width() // 2, 
+
+        score_text = shared_text.render(MENU_FONT_SIZE, f"Final Score: {score}", Colors.FOREGROUND)
+        screen.blit(score_text, (screen.get_width() // 2 - score_text.get_width() // 2,
                                  screen.get_height() // 2 - score_text.get_height() // 2))
 
         draw_menu(screen, menu_items, selected_index)
-        pygame.display.flip()
-        clock.tick(MENU_FPS)
\ No newline at end of file
+
+    return run_menu(screen, joystick, "game_over", menu_items, on_button, render=render, frame_key=score)
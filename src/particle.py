@@ -1,21 +1,87 @@
 import pygame
 import math
+import numpy as np
 from colors import Colors
 
-class Particle:
-    def __init__(self, x, y, angle, speed, lifetime):
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.speed = speed
-        self.lifetime = lifetime
+class ParticleSystem:
+    # Fixed-capacity ring of particles in preallocated columns. Bursts are
+    # written at the head in one vectorized call; once the ring is full the
+    # head wraps onto the oldest particles, so a burst never allocates and
+    # the particle count is hard capped. Dead slots stay in place with a
+    # lifetime of 0 until the head reaches them again.
+    def __init__(self, capacity=2048):
+        self.capacity = capacity
         self.size = 3
-        self.color = Colors.FOREGROUND  # Using the new color scheme
+        self.color = Colors.FOREGROUND
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.head = 0
+        self.count = 0
+        self.high_water = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, rng, n=20, speed=(1, 3), lifetime=(30, 60)):
+        # x and y may be arrays of origins, each one gets a burst of n
+        xs = np.repeat(np.atleast_1d(np.asarray(x, dtype=np.float64)), n)[-self.capacity:]
+        ys = np.repeat(np.atleast_1d(np.asarray(y, dtype=np.float64)), n)[-self.capacity:]
+        n = len(xs)
+        rows = (self.head + np.arange(n)) % self.capacity
+        self.head = (self.head + n) % self.capacity
+        overwritten = int(np.count_nonzero(self.lifetime[rows]))
+        self.evicted += overwritten
+        self.count += n - overwritten
+        self.high_water = max(self.high_water, self.count)
+
+        angles = rng.uniform(0, 2 * math.pi, n)
+        speeds = rng.uniform(speed[0], speed[1], n)
+        self.x[rows] = self.prev_x[rows] = xs
+        self.y[rows] = self.prev_y[rows] = ys
+        self.vx[rows] = speeds * np.cos(angles)
+        self.vy[rows] = speeds * np.sin(angles)
+        self.lifetime[rows] = rng.integers(lifetime[0], lifetime[1] + 1, n)
 
     def update(self):
-        self.x += self.speed * math.cos(self.angle)
-        self.y += self.speed * math.sin(self.angle)
-        self.lifetime -= 1
+        if self.count == 0:
+            return
+        # Dead slots integrate along with live ones; it is cheaper than masking
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        self.x += self.vx
+        self.y += self.vy
+        self.lifetime -= self.lifetime > 0
+        self.count = int(np.count_nonzero(self.lifetime))
+
+    def live_rows(self):
+        return np.flatnonzero(self.lifetime > 0)
+
+    def positions(self, alpha=1.0):
+        rows = self.live_rows()
+        if alpha >= 1.0:
+            return self.x[rows], self.y[rows]
+        return (self.prev_x[rows] + (self.x[rows] - self.prev_x[rows]) * alpha,
+                self.prev_y[rows] + (self.y[rows] - self.prev_y[rows]) * alpha)
+
+    def copy_from(self, other):
+        for mine, theirs in ((self.x, other.x), (self.y, other.y), (self.prev_x, other.prev_x),
+                             (self.prev_y, other.prev_y), (self.lifetime, other.lifetime)):
+            np.copyto(mine, theirs)
+        self.head = other.head
+        self.count = other.count
+
+    def clear(self):
+        self.lifetime[:] = 0
+        self.head = 0
+        self.count = 0
 
     def draw(self, screen):
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
\ No newline at end of file
+        xs, ys = self.positions()
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), self.size)
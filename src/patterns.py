@@ -0,0 +1,88 @@
+import math
+import numpy as np
+
+class BulletPattern:
+    # One volley as precomputed tables: an angle offset and a speed factor per
+    # bullet. Aimed patterns are offset from the angle to the player, the others
+    # turn by `spin` radians every volley. A volley is fired every `cadence` ticks.
+    def __init__(self, name, angles, speeds=1.0, cadence=4, aimed=False, spin=0.0):
+        self.name = name
+        self.angles = np.asarray(angles, dtype=np.float64)
+        self.speeds = np.broadcast_to(np.asarray(speeds, dtype=np.float64), self.angles.shape).copy()
+        self.cadence = cadence
+        self.aimed = aimed
+        self.spin = spin
+
+    def __len__(self):
+        return len(self.angles)
+
+    def volley(self, aim, index):
+        base = aim if self.aimed else index * self.spin
+        return self.angles + base, self.speeds
+
+def spiral(arms, spin, cadence=4):
+    return BulletPattern("spiral", np.arange(arms) * (2 * math.pi / arms), cadence=cadence, spin=spin)
+
+def aimed_fan(spread, spacing=0.2, cadence=10):
+    return BulletPattern("aimed_fan", np.arange(-spread // 2, spread // 2 + 1) * spacing, cadence=cadence, aimed=True)
+
+def ring(count, cadence=20):
+    # Every other ring is rotated half a gap so the rings interleave
+    return BulletPattern("ring", np.arange(count) * (2 * math.pi / count), cadence=cadence, spin=math.pi / count)
+
+def stream(count, spread=0.05, cadence=15):
+    # A tight aimed line whose bullets leave at staggered speeds
+    return BulletPattern("stream", np.linspace(-spread, spread, count), np.linspace(0.7, 1.5, count),
+                         cadence=cadence, aimed=True)
+
+def flower(petals, per_petal, cadence=6, spin=0.15):
+    # Petals of bullets where the outer edges fly slower than the middle
+    offsets = np.linspace(-0.25, 0.25, per_petal)
+    angles = (np.arange(petals)[:, None] * (2 * math.pi / petals) + offsets).ravel()
+    speeds = np.tile(1.0 - np.abs(offsets) * 1.6, petals)
+    return BulletPattern("flower", angles, speeds, cadence=cadence, spin=spin)
+
+def boss_schedule(difficulty):
+    # The phases a boss cycles through as (pattern, ticks); tables only
+    # depend on difficulty, so a schedule is built once per difficulty step
+    return [
+        (spiral(int(8 * difficulty), spin=0.6 * difficulty), 120),
+        (aimed_fan(5 + int(difficulty)), 60),
+        (ring(int(16 * difficulty)), 80),
+        (flower(5, 5), 90),
+        (stream(6 + 2 * int(difficulty)), 60),
+    ]
+
+class PatternEmitter:
+    # Per-boss position in the schedule, plus a token bucket that refills at
+    # `budget` bullets per second; a volley that does not fit is skipped
+    # whole so patterns never fire half-drawn.
+    def __init__(self, budget, tick_rate=60):
+        self.budget = budget
+        self.refill = budget / tick_rate
+        self.tokens = budget
+        self.phase = 0
+        self.phase_tick = 0
+        self.volleys = 0
+        self.fired = 0
+        self.skipped = 0
+
+    def fire(self, schedule, x, y, aim, speed, enemy_bullets):
+        self.tokens = min(self.budget, self.tokens + self.refill)
+        pattern, duration = schedule[self.phase % len(schedule)]
+        if self.phase_tick % pattern.cadence == 0:
+            n = len(pattern)
+            if self.tokens >= n:
+                self.tokens -= n
+                angles, speeds = pattern.volley(aim, self.volleys)
+                enemy_bullets.spawn_many(x, y, angles, speed=speeds * speed)
+                self.fired += n
+            else:
+                self.skipped += 1
+            self.volleys += 1
+
+        self.phase_tick += 1
+        if self.phase_tick >= duration:
+            self.phase = (self.phase + 1) % len(schedule)
+            self.phase_tick = 0
+            self.volleys = 0
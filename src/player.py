@@ -1,13 +1,12 @@
 import pygame
 import math
 import random
-from bullet import Bullet
 from colors import Colors
 
 class Player:
     def __init__(self, x, y, screen_width, screen_height):
-        self.x = x
-        self.y = y
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.size = 20
@@ -30,6 +29,7 @@ class Player:
         self.glow_timer = 0
 
     def move(self, dx, dy):
+        self.prev_x, self.prev_y = self.x, self.y
         if self.kickback_timer > 0:
             self.x -= dx * self.speed * 0.5
             self.y -= dy * self.speed * 0.5
@@ -40,38 +40,28 @@ class Player:
     def aim(self, angle):
         self.angle = angle
 
-    def shoot(self, bullets):
+    def shoot(self, bullets, rng=random):
         if self.fire_cooldown == 0:
             if self.current_weapon == "default":
-                bullet = Bullet(self.x, self.y, self.angle, friendly=True)
-                bullet.start_glow()
-                bullets.append(bullet)
+                bullets.spawn(self.x, self.y, self.angle, glow=True)
                 self.fire_cooldown = self.fire_rate
                 self.kickback_timer = 5
             elif self.current_weapon == "spread":
                 for i in range(-1, 2):
-                    bullet = Bullet(self.x, self.y, self.angle + i * 0.2, friendly=True)
-                    bullet.start_glow()
-                    bullets.append(bullet)
+                    bullets.spawn(self.x, self.y, self.angle + i * 0.2, glow=True)
                 self.fire_cooldown = self.fire_rate * 2
                 self.kickback_timer = 8
             elif self.current_weapon == "laser":
-                bullet = Bullet(self.x, self.y, self.angle, friendly=True, speed=20, bullet_type="laser")
-                bullet.start_glow()
-                bullets.append(bullet)
+                bullets.spawn(self.x, self.y, self.angle, speed=20, bullet_type="laser", glow=True)
                 self.fire_cooldown = self.fire_rate // 2
                 self.kickback_timer = 3
             elif self.current_weapon == "homing":
-                bullet = Bullet(self.x, self.y, self.angle, friendly=True, speed=5, bullet_type="homing")
-                bullet.start_glow()
-                bullets.append(bullet)
+                bullets.spawn(self.x, self.y, self.angle, speed=5, bullet_type="homing", glow=True)
                 self.fire_cooldown = self.fire_rate
                 self.kickback_timer = 5
             elif self.current_weapon == "multishot":
                 for _ in range(3):
-                    bullet = Bullet(self.x, self.y, self.angle + random.uniform(-0.1, 0.1), friendly=True)
-                    bullet.start_glow()
-                    bullets.append(bullet)
+                    bullets.spawn(self.x, self.y, self.angle + rng.uniform(-0.1, 0.1), glow=True)
                 self.fire_cooldown = self.fire_rate * 2
                 self.kickback_timer = 8
 
@@ -113,35 +103,41 @@ class Player:
         if self.glow_timer > 0:
             self.glow_timer -= 1
 
-    def draw(self, screen):
+    def copy_from(self, other):
+        self.__dict__.update(other.__dict__)
+
+    def draw(self, screen, effects, alpha=1.0, angle=None):
+        # angle overrides the simulated aim for this frame only
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        angle = self.angle if angle is None else angle
+
         # Draw player triangle
         points = [
-            (self.x + self.size * math.cos(self.angle), self.y + self.size * math.sin(self.angle)),
-            (self.x + self.size * math.cos(self.angle + 2.5), self.y + self.size * math.sin(self.angle + 2.5)),
-            (self.x + self.size * math.cos(self.angle - 2.5), self.y + self.size * math.sin(self.angle - 2.5))
+            (x + self.size * math.cos(angle), y + self.size * math.sin(angle)),
+            (x + self.size * math.cos(angle + 2.5), y + self.size * math.sin(angle + 2.5)),
+            (x + self.size * math.cos(angle - 2.5), y + self.size * math.sin(angle - 2.5))
         ]
-        pygame.draw.polygon(screen, Colors.PLAYER_COLOR, points)
+        drawn = pygame.draw.polygon(screen, Colors.PLAYER_COLOR, points)
 
         # Draw hitbox indicator
-        pygame.draw.circle(screen, Colors.RED, (int(self.x), int(self.y)), self.hitbox_size, 1)
+        drawn.union_ip(pygame.draw.circle(screen, Colors.RED, (int(x), int(y)), self.hitbox_size, 1))
 
         # Draw shield if active
         if self.shield_active:
-            pygame.draw.circle(screen, Colors.SHIELD_COLOR, (int(self.x), int(self.y)), self.size + 5, 2)
+            drawn.union_ip(pygame.draw.circle(screen, Colors.SHIELD_COLOR, (int(x), int(y)), self.size + 5, 2))
 
         # Draw sword attack if active
         if self.sword_cooldown > self.sword_cooldown_max // 2:
-            end_x = self.x + self.sword_range * math.cos(self.angle)
-            end_y = self.y + self.sword_range * math.sin(self.angle)
-            pygame.draw.line(screen, Colors.PLAYER_COLOR, (self.x, self.y), (end_x, end_y), 2)
+            end_x = x + self.sword_range * math.cos(angle)
+            end_y = y + self.sword_range * math.sin(angle)
+            drawn.union_ip(pygame.draw.line(screen, Colors.PLAYER_COLOR, (x, y), (end_x, end_y), 2))
 
         if self.glow_timer > 0:
-            glow_color = Colors.PLAYER_COLOR
-            glow_size = self.size + self.glow_timer // 5
-            glow_alpha = 128 * (self.glow_timer / 30)
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*glow_color, int(glow_alpha)), (glow_size, glow_size), glow_size)
-            screen.blit(glow_surface, (int(self.x - glow_size), int(self.y - glow_size)))
+            glow, (ox, oy) = effects.glow(Colors.PLAYER_COLOR, self.size + self.glow_timer // 5,
+                                          128 * (self.glow_timer / 30))
+            drawn.union_ip(screen.blit(glow, (int(x + ox), int(y + oy))))
+        return drawn
 
     def collides_with(self, other):
         return math.hypot(self.x - other.x, self.y - other.y) < self.hitbox_size + other.size
@@ -0,0 +1,45 @@
+class EntityPool:
+    # Free list of released entities. acquire() hands back a released object
+    # re-initialized through its reset() before it builds a new one, so a
+    # wave spawn after the first few waves allocates nothing. The caller must
+    # drop every other reference to an object before releasing it.
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+        self.created = 0
+        self.acquired = 0
+        self.released = 0
+        self.high_water = 0
+
+    def acquire(self, *args):
+        self.acquired += 1
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args)
+        else:
+            entity = self.cls(*args)
+            self.created += 1
+        self.high_water = max(self.high_water, self.live)
+        return entity
+
+    def release(self, entity):
+        self.released += 1
+        self.free.append(entity)
+
+    def release_all(self, entities):
+        self.released += len(entities)
+        self.free.extend(entities)
+
+    @property
+    def live(self):
+        return self.acquired - self.released
+
+    def stats(self):
+        reused = self.acquired - self.created
+        return {
+            "live": self.live,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reuse_rate": reused / self.acquired if self.acquired else 0.0,
+        }
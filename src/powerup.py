@@ -1,8 +1,11 @@
 import pygame
 import math
 from colors import Colors
+from fonts import shared_text
 
 class PowerUp:
+    __slots__ = ("x", "y", "size", "type", "pulsate_timer")
+
     def __init__(self, x, y, powerup_type):
         self.x = x
         self.y = y
@@ -15,8 +18,7 @@ class PowerUp:
         pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
         
         # Draw an icon or letter to represent the powerup type
-        font = pygame.font.Font(None, 20)
-        text = font.render(self.get_icon(), True, Colors.BACKGROUND)
+        text = shared_text.render(20, self.get_icon(), Colors.BACKGROUND)
         text_rect = text.get_rect(center=(self.x, self.y))
         screen.blit(text, text_rect)
 
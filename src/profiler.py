@@ -0,0 +1,203 @@
+import json
+import threading
+import time
+import numpy as np
+import pygame
+from colors import Colors
+from fonts import shared_fonts
+
+COUNTED_ENTITIES = ("bullets", "enemy_bullets", "enemies", "powerups", "particles")
+# Not durations: the age of the input a frame shows when it is presented
+LATENCY_SECTIONS = ("input_latency", "aim_latency")
+
+class TickProfiler:
+    # Times each update subsystem and render pass with perf_counter_ns. The
+    # last `window` samples of every section live in a ring so percentiles
+    # are always over recent ticks, and each tick can be streamed to CSV or
+    # NDJSON. Game only routes through here when a profiler is attached, so
+    # a game without one pays nothing. With a simulation thread, ticks and
+    # frames record from different threads: every write holds `lock`, and a
+    # tick's or frame's samples are committed together so a row never holds
+    # part of one frame.
+    def __init__(self, update_sections, draw_sections, window=600, stream_path=None):
+        self.update_sections = tuple(update_sections)
+        self.draw_sections = tuple(draw_sections)
+        self.sections = self.update_sections + self.draw_sections + ("tick", "frame") + LATENCY_SECTIONS
+        self.window = window
+        self.samples = {name: np.zeros(window, dtype=np.int64) for name in self.sections}
+        self.filled = {name: 0 for name in self.sections}
+        self.counts = {name: 0 for name in COUNTED_ENTITIES}
+        self.tick = 0
+        self.overlay_visible = False
+        self.overlay = None
+        self.overlay_age = 0
+        self.overlay_font = None
+        self.stream = None
+        self.stream_format = None
+        self.pending = {}
+        self.lock = threading.Lock()
+        if stream_path:
+            self.open_stream(stream_path)
+
+    def open_stream(self, path):
+        self.stream = open(path, "w", buffering=1 << 16)
+        self.stream_format = "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+        if self.stream_format == "csv":
+            columns = ("tick",) + tuple(f"{name}_ns" for name in self.sections) + COUNTED_ENTITIES
+            self.stream.write(",".join(columns) + "\n")
+
+    def close(self):
+        with self.lock:
+            self.flush_tick()
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+
+    def add_sample(self, name, elapsed_ns):
+        self.add_samples(((name, elapsed_ns),))
+
+    def add_samples(self, samples):
+        with self.lock:
+            for name, elapsed_ns in samples:
+                slot = self.filled[name] % self.window
+                self.samples[name][slot] = elapsed_ns
+                self.filled[name] += 1
+                self.pending[name] = elapsed_ns
+
+    def run_steps(self, steps, total_name, extra=None):
+        # extra, when given, returns more (name, value) samples to commit
+        # with the steps once they have run
+        clock = time.perf_counter_ns
+        timings = []
+        start = previous = clock()
+        for name, step in steps:
+            step()
+            now = clock()
+            timings.append((name, now - previous))
+            previous = now
+        timings.append((total_name, previous - start))
+        if extra is not None:
+            timings.extend(extra())
+        self.add_samples(timings)
+
+    def count_entities(self, game):
+        self.counts["bullets"] = len(game.bullets)
+        self.counts["enemy_bullets"] = len(game.enemy_bullets)
+        self.counts["enemies"] = len(game.enemies)
+        self.counts["powerups"] = len(game.powerups)
+        self.counts["particles"] = len(game.particles)
+
+    def flush_tick(self):
+        # A row is written when the next tick starts, so it holds the update
+        # and the frame drawn after it along with the counts that frame saw
+        if not self.pending:
+            return
+        if self.stream is not None:
+            self.write_row()
+        self.pending = {}
+        self.tick += 1
+
+    def start_tick(self, game):
+        with self.lock:
+            self.count_entities(game)
+            self.flush_tick()
+
+    def write_row(self):
+        # Sections that did not run this tick (no frame drawn) are left empty
+        if self.stream_format == "csv":
+            values = [str(self.tick)]
+            values.extend(str(self.pending.get(name, "")) for name in self.sections)
+            values.extend(str(self.counts[name]) for name in COUNTED_ENTITIES)
+            self.stream.write(",".join(values) + "\n")
+        else:
+            row = {"tick": self.tick, "ns": self.pending, "counts": self.counts}
+            self.stream.write(json.dumps(row) + "\n")
+
+    def percentiles(self, name, quantiles=(50, 95, 99)):
+        with self.lock:
+            filled = min(self.filled[name], self.window)
+            window = self.samples[name][:filled].copy()
+        if filled == 0:
+            return tuple(0.0 for _ in quantiles)
+        values = np.percentile(window, quantiles)
+        return tuple(float(v) / 1e6 for v in values)  # In milliseconds
+
+    def summary(self):
+        return {name: dict(zip(("p50_ms", "p95_ms", "p99_ms"), self.percentiles(name))) for name in self.sections}
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay = None
+
+    def draw_overlay(self, screen, refresh_frames=30):
+        # The overlay text is rebuilt twice a second, in between it is one blit
+        if self.overlay is None or self.overlay_age >= refresh_frames:
+            self.overlay = self.render_overlay()
+            self.overlay_age = 0
+        self.overlay_age += 1
+        return screen.blit(self.overlay, (10, screen.get_height() - self.overlay.get_height() - 10))
+
+    def render_overlay(self):
+        lines = [f"{'section':<14}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name in self.sections:
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"{name:<14}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+        with self.lock:
+            counts = dict(self.counts)
+        lines.append("  ".join(f"{name} {count}" for name, count in counts.items()))
+
+        # Numbers change every refresh, so these skip the shared text cache
+        if self.overlay_font is None:
+            self.overlay_font = shared_fonts.get(20, pygame.font.match_font("monospace"))
+        rendered = [self.overlay_font.render(line, True, Colors.FOREGROUND) for line in lines]
+        height = sum(text.get_height() for text in rendered)
+        width = max(text.get_width() for text in rendered)
+        overlay = pygame.Surface((width + 12, height + 12))
+        overlay.fill(Colors.UI_BACKGROUND_COLOR)
+        y = 6
+        for text in rendered:
+            overlay.blit(text, (6, y))
+            y += text.get_height()
+        return overlay
+
+# Time to first menu on a cabinet, split into the phases main() goes through
+STARTUP_BUDGET_MS = {
+    "imports": 500,
+    "display": 250,
+    "joystick": 100,
+    "game": 50,
+    "first_menu": 100,
+}
+
+class StartupProfiler:
+    # Wall time of each startup phase, from `start_ns` (taken before the
+    # heavy imports) to the first menu frame, against a budget per phase
+    def __init__(self, start_ns, budgets=STARTUP_BUDGET_MS):
+        self.start_ns = start_ns
+        self.last_ns = start_ns
+        self.budgets = budgets
+        self.phases = []
+
+    def mark(self, name):
+        now = time.perf_counter_ns()
+        self.phases.append((name, now - self.last_ns))
+        self.last_ns = now
+
+    def total_ms(self):
+        return (self.last_ns - self.start_ns) / 1e6
+
+    def report(self, total_budget_ms=None, background=()):
+        # background: (name, ms or None while still running) for work kept off the path to the menu
+        if total_budget_ms is None:
+            total_budget_ms = sum(self.budgets.values())
+        lines = [f"{'phase':<14}{'ms':>9}{'budget':>9}"]
+        for name, ns in self.phases:
+            ms = ns / 1e6
+            budget = self.budgets.get(name)
+            over = "  over" if budget is not None and ms > budget else ""
+            lines.append(f"{name:<14}{ms:>9.1f}{budget if budget is not None else '-':>9}{over}")
+        total = self.total_ms()
+        lines.append(f"{'total':<14}{total:>9.1f}{total_budget_ms:>9.0f}{'  over' if total > total_budget_ms else ''}")
+        for name, ms in background:
+            lines.append(f"{name:<14}{'running' if ms is None else f'{ms:.1f}':>9}  in the background")
+        return "\n".join(lines)
@@ -0,0 +1,89 @@
+import numpy as np
+
+# Graze zones, from the outside in
+ZONE_NONE = 0
+ZONE_OUTER = 1
+ZONE_INNER = 2
+
+class PlayerProximity:
+    # Everything the player can touch or graze, measured once per tick. The
+    # collision step calls measure() before resolving anything: one squared
+    # distance per enemy bullet, enemy and power-up, each classified as a
+    # hit (closer than the player's hitbox plus its own size) and by graze
+    # zone. Collisions resolve the hits, the graze step reads the zones of
+    # whatever was still in the arena afterwards.
+    def __init__(self):
+        self.bullet_count = 0
+        self.enemies = []
+        self.dx = np.zeros(0)
+        self.dy = np.zeros(0)
+        self.hit = np.zeros(0, dtype=bool)
+        self.zone = np.zeros(0, dtype=np.int8)
+        self.powerups_picked = np.zeros(0, dtype=np.int64)
+        self.bullets_cleared = False
+
+    def measure(self, player, enemy_bullets, enemies, powerups, inner_distance, outer_distance):
+        # Enemy bullets first, then enemies, in one set of rows
+        n = enemy_bullets.count
+        total = n + len(enemies)
+        xs = np.empty(total)
+        ys = np.empty(total)
+        reach = np.empty(total)
+        xs[:n] = enemy_bullets.x[:n]
+        ys[:n] = enemy_bullets.y[:n]
+        reach[:n] = enemy_bullets.size
+        xs[n:] = [e.x for e in enemies]
+        ys[n:] = [e.y for e in enemies]
+        reach[n:] = [e.size for e in enemies]
+
+        dx = np.subtract(xs, player.x, out=xs)
+        dy = np.subtract(ys, player.y, out=ys)
+        distance_sq = dx * dx + dy * dy
+        reach += player.hitbox_size
+        self.hit = distance_sq < reach * reach
+        # Anything inside the bare hitbox is too close to count as a graze
+        zone = np.zeros(total, dtype=np.int8)
+        zone[distance_sq <= outer_distance ** 2] = ZONE_OUTER
+        zone[distance_sq <= inner_distance ** 2] = ZONE_INNER
+        zone[distance_sq <= player.hitbox_size ** 2] = ZONE_NONE
+        self.zone = zone
+        self.dx = dx
+        self.dy = dy
+        self.bullet_count = n
+        self.enemies = list(enemies)
+        self.bullets_cleared = False
+
+        if powerups:
+            px = np.array([p.x for p in powerups], dtype=np.float64) - player.x
+            py = np.array([p.y for p in powerups], dtype=np.float64) - player.y
+            limit = np.array([p.size for p in powerups], dtype=np.float64) + player.hitbox_size
+            self.powerups_picked = np.flatnonzero(px * px + py * py < limit * limit)
+        else:
+            self.powerups_picked = np.zeros(0, dtype=np.int64)
+
+    @property
+    def bullets_hit(self):
+        return np.flatnonzero(self.hit[:self.bullet_count])
+
+    @property
+    def enemies_hit(self):
+        return np.flatnonzero(self.hit[self.bullet_count:])
+
+    def clear_bullets(self):
+        # The enemy bullets were wiped after the pass (a bomb); none are left to graze
+        self.bullets_cleared = True
+
+    def graze_rows(self):
+        # Rows in a graze zone that are still in the arena: bullets that hit
+        # the player were absorbed, and enemies may have died since the pass
+        rows = np.flatnonzero(self.zone)
+        n = self.bullet_count
+        is_bullet = rows < n
+        if self.bullets_cleared:
+            keep = ~is_bullet
+        else:
+            keep = ~(is_bullet & self.hit[rows])
+        enemies = self.enemies
+        for i in np.flatnonzero(~is_bullet).tolist():
+            keep[i] = enemies[rows[i] - n].health > 0
+        return rows[keep]
@@ -0,0 +1,83 @@
+import time
+import numpy as np
+
+class QualityTier:
+    # What the draw path may spend on effects. Tiers are cumulative, each one
+    # gives up everything the tiers above it gave up.
+    def __init__(self, name, particles_per_burst=20, glow=True, pulse=True, graze_arcs=True, hud_interval=1):
+        self.name = name
+        self.particles_per_burst = particles_per_burst
+        self.glow = glow  # Bullet glows
+        self.pulse = pulse  # Power-up rings
+        self.graze_arcs = graze_arcs  # One arc per bucket, or one ring per zone
+        self.hud_interval = hud_interval  # Frames between HUD redraws when presenting dirty rects
+
+QUALITY_TIERS = (
+    QualityTier("full"),
+    QualityTier("fewer_particles", particles_per_burst=8),
+    QualityTier("no_glow", particles_per_burst=8, glow=False, pulse=False),
+    QualityTier("merged_graze", particles_per_burst=8, glow=False, pulse=False, graze_arcs=False),
+    QualityTier("slow_hud", particles_per_burst=8, glow=False, pulse=False, graze_arcs=False, hud_interval=4),
+)
+QUALITY_TIER_NAMES = {tier.name: tier for tier in QUALITY_TIERS}
+
+class QualityGovernor:
+    # Steps down a tier when the 90th percentile of the last `window` frame
+    # times goes over budget, and back up only after `hold_ms` of frame time
+    # at the current tier with that percentile under `step_up` of the
+    # budget, so a tier does not flap at the edge of the budget whatever the
+    # frame rate. Frame time is the work done for a frame, not including
+    # time spent waiting on the cap.
+    def __init__(self, budget_ms=1000 / 60, window=30, step_up=0.7, hold_ms=3000, tiers=QUALITY_TIERS):
+        self.budget_ns = int(budget_ms * 1e6)
+        self.window = window
+        self.step_up = step_up
+        self.hold_ns = int(hold_ms * 1e6)
+        self.tiers = tiers
+        self.level = 0
+        self.samples = np.zeros(window, dtype=np.int64)
+        self.filled = 0
+        self.ns_at_level = 0
+        self.frames = 0
+        self.time_in_tier = [0] * len(tiers)  # Wall time in ns
+        self.changes = []  # (frame, from tier, to tier, p90 ms)
+        self.entered = time.perf_counter_ns()
+
+    @property
+    def tier(self):
+        return self.tiers[self.level]
+
+    def record(self, frame_ns):
+        # Returns True when the tier changed
+        self.samples[self.filled % self.window] = frame_ns
+        self.filled += 1
+        self.frames += 1
+        self.ns_at_level += frame_ns
+        if self.filled < self.window or self.filled % self.window:
+            return False
+        p90 = float(np.percentile(self.samples, 90))
+        if p90 > self.budget_ns and self.level < len(self.tiers) - 1:
+            self.set_level(self.level + 1, p90)
+            return True
+        if (p90 < self.budget_ns * self.step_up and self.level > 0
+                and self.ns_at_level >= self.hold_ns):
+            self.set_level(self.level - 1, p90)
+            return True
+        return False
+
+    def set_level(self, level, p90_ns=0.0):
+        now = time.perf_counter_ns()
+        self.time_in_tier[self.level] += now - self.entered
+        self.entered = now
+        self.changes.append((self.frames, self.tier.name, self.tiers[level].name, p90_ns / 1e6))
+        self.level = level
+        self.ns_at_level = 0
+        # The next decision only looks at frames drawn at the new tier
+        self.filled = 0
+
+    def report(self):
+        seconds = list(self.time_in_tier)
+        seconds[self.level] += time.perf_counter_ns() - self.entered
+        spent = ", ".join(f"{tier.name} {ns / 1e9:.1f}s" for tier, ns in zip(self.tiers, seconds) if ns)
+        return (f"quality: {len(self.changes)} tier changes over {self.frames} frames, "
+                f"budget {self.budget_ns / 1e6:.1f} ms; {spent}")
@@ -0,0 +1,27 @@
+import random
+import zlib
+import numpy as np
+
+class RandomStreams:
+    # One seeded generator per gameplay system, all derived from a single game
+    # seed. Systems draw only from their own stream, so a change in how often
+    # one of them rolls does not shift every other roll in the game.
+    STREAMS = ("spawn", "enemies", "powerups", "player")
+    ARRAY_STREAMS = ("particles", "enemy_ai")  # NumPy generators, for systems that roll whole batches at once
+
+    def __init__(self, seed=None):
+        for name in self.STREAMS:
+            setattr(self, name, random.Random())
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        # The random.Random streams are seeded in place, so systems holding one
+        # keep it; the NumPy generators are replaced and must be looked up here
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.STREAMS:
+            getattr(self, name).seed(f"{seed}:{name}")
+        for name in self.ARRAY_STREAMS:
+            setattr(self, name, np.random.default_rng([seed % 2 ** 64, zlib.crc32(name.encode())]))
+        return seed
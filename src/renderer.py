@@ -0,0 +1,164 @@
+import math
+from itertools import repeat
+import numpy as np
+import pygame
+from bullet import BULLET_TYPE_CODES
+from colors import Colors
+from fonts import shared_text
+
+class SpriteBatchRenderer:
+    # Draws entities as pre-rasterized sprites. Every appearance (bullet by
+    # side and type, enemy by colour and size, particle, power-up by type) is
+    # rendered once, and each layer is submitted with one Surface.blits call.
+    def __init__(self, effects, angle_steps=64):
+        self.effects = effects
+        self.angle_steps = angle_steps
+        self.sprites = {}
+        self.dirty_rects = None  # A list while a dirty-rect frame is being drawn
+
+    def sprite(self, key, render):
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            surface, offset = render()
+            # Opaque sprites with a colour key blit much faster than per-pixel alpha
+            surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            sprite = self.sprites[key] = (surface, offset)
+        return sprite
+
+    def circle(self, color, radius, width=0):
+        def render():
+            surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+            pygame.draw.circle(surface, color, (radius, radius), radius, width)
+            return surface, (-radius, -radius)
+        return self.sprite(("circle", color, radius, width), render)
+
+    def laser(self, color, length, angle_step):
+        def render():
+            angle = angle_step * (2 * math.pi / self.angle_steps)
+            half = length + 2
+            surface = pygame.Surface((half * 2, half * 2))
+            pygame.draw.line(surface, color, (half, half),
+                             (int(half + length * math.cos(angle)), int(half + length * math.sin(angle))), 2)
+            return surface, (-half, -half)
+        return self.sprite(("laser", color, length, angle_step), render)
+
+    def powerup_body(self, powerup):
+        def render():
+            size = powerup.size
+            surface = pygame.Surface((size * 2 + 1, size * 2 + 1))
+            pygame.draw.circle(surface, powerup.get_color(), (size, size), size)
+            text = shared_text.render(20, powerup.get_icon(), Colors.BACKGROUND)
+            surface.blit(text, text.get_rect(center=(size, size)))
+            return surface, (-size, -size)
+        return self.sprite(("powerup", powerup.type, powerup.size), render)
+
+    def submit(self, screen, blits):
+        if self.dirty_rects is None:
+            screen.blits(blits, doreturn=False)
+        else:
+            self.dirty_rects.extend(screen.blits(blits))
+
+    def draw_bullets(self, screen, store, alpha=1.0, glow=True):
+        n = store.count
+        if n == 0:
+            return
+        color = Colors.BULLET_COLOR if store.friendly else Colors.ENEMY_COLOR
+        xs, ys = store.positions(alpha)
+        xs = xs.astype(np.int64)
+        ys = ys.astype(np.int64)
+        laser = store.type[:n] == BULLET_TYPE_CODES["laser"]
+
+        body, (ox, oy) = self.circle(color, store.size)
+        round_rows = ~laser
+        blits = list(zip(repeat(body), zip((xs[round_rows] + ox).tolist(), (ys[round_rows] + oy).tolist())))
+
+        if laser.any():
+            rows = np.flatnonzero(laser)
+            steps = (np.round(np.arctan2(store.vy[rows], store.vx[rows]) / (2 * math.pi) * self.angle_steps)
+                     .astype(np.int64) % self.angle_steps)
+            lengths = (store.speed[rows] * 2).astype(np.int64)
+            for x, y, length, step in zip(xs[rows].tolist(), ys[rows].tolist(), lengths.tolist(), steps.tolist()):
+                sprite, (ox, oy) = self.laser(color, length, step)
+                blits.append((sprite, (x + ox, y + oy)))
+
+        if glow:
+            glowing = np.flatnonzero(store.glow_timer[:n] > 0)
+            for x, y, timer in zip(xs[glowing].tolist(), ys[glowing].tolist(), store.glow_timer[glowing].tolist()):
+                sprite, (ox, oy) = self.effects.glow(color, store.size + timer // 5, 128 * (timer / 30))
+                blits.append((sprite, (x + ox, y + oy)))
+
+        self.submit(screen, blits)
+
+    def draw_enemies(self, screen, enemies, alpha=1.0):
+        blits = []
+        for enemy in enemies:
+            color = Colors.BOSS_COLOR if enemy.type == "boss" else Colors.ENEMY_COLOR
+            sprite, (ox, oy) = self.circle(color, enemy.size)
+            x = enemy.prev_x + (enemy.x - enemy.prev_x) * alpha
+            y = enemy.prev_y + (enemy.y - enemy.prev_y) * alpha
+            blits.append((sprite, (int(x) + ox, int(y) + oy)))
+        self.submit(screen, blits)
+
+    def draw_powerups(self, screen, powerups, pulse=True):
+        blits = []
+        for powerup in powerups:
+            x, y = int(powerup.x), int(powerup.y)
+            body, (ox, oy) = self.powerup_body(powerup)
+            blits.append((body, (x + ox, y + oy)))
+            if not pulse:
+                continue
+
+            # Pulsating ring
+            powerup.pulsate_timer += 0.1
+            offset = int(math.sin(powerup.pulsate_timer) * 3)
+            ring, (ox, oy) = self.circle(powerup.get_color(), powerup.size + offset, 2)
+            blits.append((ring, (x + ox, y + oy)))
+        self.submit(screen, blits)
+
+    def draw_particles(self, screen, particles, alpha=1.0):
+        if len(particles) == 0:
+            return
+        sprite, (ox, oy) = self.circle(particles.color, particles.size)
+        xs, ys = particles.positions(alpha)
+        xs = xs.astype(np.int64) + ox
+        ys = ys.astype(np.int64) + oy
+        self.submit(screen, list(zip(repeat(sprite), zip(xs.tolist(), ys.tolist()))))
+
+class DirtyRectPresenter:
+    # Presents only what changed: last frame's entity rects are restored from
+    # the pre-composed background before drawing, and the union of old and new
+    # rects goes to display.update. Busy frames fall back to a full flip.
+    def __init__(self, background, threshold=0.4):
+        self.background = background
+        self.screen_rect = background.get_rect()
+        self.threshold = threshold
+        self.previous = []
+        self.needs_full = True
+        self.full_presents = 0
+        self.partial_presents = 0
+
+    def invalidate(self):
+        self.needs_full = True
+
+    def restore(self, screen):
+        if self.needs_full:
+            screen.blit(self.background, (0, 0))
+        else:
+            screen.blits([(self.background, rect, rect) for rect in self.previous], doreturn=False)
+
+    def present(self, rects, static_rects=()):
+        # static_rects go to the display this frame but are not restored on
+        # the next one; the caller erases them itself
+        rects = [rect.clip(self.screen_rect) for rect in rects]
+        dirty = self.previous + rects + [rect.clip(self.screen_rect) for rect in static_rects]
+        self.previous = rects
+        area = sum(rect.width * rect.height for rect in dirty)
+        if self.needs_full or area > self.threshold * self.screen_rect.width * self.screen_rect.height:
+            pygame.display.flip()
+            self.needs_full = False
+            self.full_presents += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_presents += 1
@@ -0,0 +1,144 @@
+import argparse
+import json
+import struct
+import sys
+
+from input_source import AXIS_COUNT, BUTTON_COUNT, RecordedInput
+
+LOG_MAGIC = b"TSSINPUT"
+LOG_VERSION = 1
+CHECKSUM_INTERVAL = 60
+AXIS_SCALE = 32767
+TICK_RECORD = struct.Struct("<%dhB" % AXIS_COUNT)  # Axes as int16 and buttons as a bitmask, 13 bytes a tick
+CHECKSUM_RECORD = struct.Struct("<I")
+
+def quantize_axis(value):
+    return max(-AXIS_SCALE, min(AXIS_SCALE, round(value * AXIS_SCALE)))
+
+class InputLog:
+    # A per-tick controller log: a JSON header line (seed, arena size, checksum
+    # interval) followed by one fixed-size record per tick, and after every
+    # CHECKSUM_INTERVAL ticks the game's state checksum
+    def __init__(self, header, frames, checksums):
+        self.header = header
+        self.frames = frames
+        self.checksums = checksums
+
+    @classmethod
+    def read(cls, path):
+        with open(path, "rb") as f:
+            magic = f.read(len(LOG_MAGIC))
+            if magic != LOG_MAGIC:
+                raise ValueError(f"{path} is not an input log")
+            header = json.loads(f.readline())
+            data = f.read()
+
+        interval = header["checksum_interval"]
+        frames = []
+        checksums = {}
+        offset = 0
+        while offset + TICK_RECORD.size <= len(data):
+            record = TICK_RECORD.unpack_from(data, offset)
+            offset += TICK_RECORD.size
+            axes = [raw / AXIS_SCALE for raw in record[:AXIS_COUNT]]
+            mask = record[AXIS_COUNT]
+            frames.append((axes, [(mask >> i) & 1 for i in range(BUTTON_COUNT)]))
+            if len(frames) % interval == 0:
+                if offset + CHECKSUM_RECORD.size > len(data):
+                    break  # Log was cut off mid-tick
+                checksums[len(frames)] = CHECKSUM_RECORD.unpack_from(data, offset)[0]
+                offset += CHECKSUM_RECORD.size
+        return cls(header, frames, checksums)
+
+class InputRecorder:
+    # Sits between a joystick and the game. sample() latches the controller
+    # once per tick, quantized exactly as the log stores it, so the live game
+    # and its replay see the same values.
+    def __init__(self, joystick):
+        self.joystick = joystick
+        self.axes = [0.0] * AXIS_COUNT
+        self.buttons = [0] * BUTTON_COUNT
+        self.file = None
+        self.ticks = 0
+
+    def init(self):
+        self.joystick.init()
+
+    def get_axis(self, axis):
+        return self.axes[axis]
+
+    def get_button(self, button):
+        return self.buttons[button]
+
+    def start(self, path, seed, screen_size):
+        self.close()
+        self.file = open(path, "wb")
+        header = {"version": LOG_VERSION, "seed": seed, "screen_size": list(screen_size),
+                  "checksum_interval": CHECKSUM_INTERVAL}
+        self.file.write(LOG_MAGIC + json.dumps(header).encode() + b"\n")
+        self.ticks = 0
+
+    def sample(self):
+        num_axes = min(self.joystick.get_numaxes(), AXIS_COUNT)
+        num_buttons = min(self.joystick.get_numbuttons(), BUTTON_COUNT)
+        raw_axes = [quantize_axis(self.joystick.get_axis(i)) if i < num_axes else 0 for i in range(AXIS_COUNT)]
+        mask = 0
+        for i in range(num_buttons):
+            if self.joystick.get_button(i):
+                mask |= 1 << i
+        self.axes = [raw / AXIS_SCALE for raw in raw_axes]
+        self.buttons = [(mask >> i) & 1 for i in range(BUTTON_COUNT)]
+        if self.file is not None:
+            self.file.write(TICK_RECORD.pack(*raw_axes, mask))
+
+    def end_tick(self, game):
+        if self.file is None:
+            return
+        self.ticks += 1
+        if self.ticks % CHECKSUM_INTERVAL == 0:
+            self.file.write(CHECKSUM_RECORD.pack(game.state_checksum()))
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+def replay(log, profile_out=None):
+    # Re-simulates a log headless with no frame pacing; returns the run stats
+    # and the first tick whose checksum differs from the recording, or None
+    from headless import create_game, run
+
+    source = RecordedInput(log.frames)
+    game = create_game(source, tuple(log.header["screen_size"]), seed=log.header["seed"])
+    if profile_out:
+        game.attach_profiler(profile_out)
+    divergence = []
+
+    def check(game, ticks):
+        expected = log.checksums.get(ticks)
+        if expected is not None and not divergence and game.state_checksum() != expected:
+            divergence.append(ticks)
+
+    stats = run(game, source, len(log.frames), stop_on_death=False, on_tick=check)
+    if game.profiler is not None:
+        game.profiler.close()
+    return stats, divergence[0] if divergence else None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded input log at full speed")
+    parser.add_argument("log", help="input log written by main.py --record")
+    parser.add_argument("--profile-out", help="stream per-tick update timings to this .csv or .ndjson file")
+    args = parser.parse_args(argv)
+
+    log = InputLog.read(args.log)
+    stats, divergence = replay(log, args.profile_out)
+    print(f"{stats['ticks']} ticks in {stats['seconds']:.2f}s ({stats['ticks_per_second']:.0f} ticks/s), "
+          f"wave {stats['wave']}, score {stats['score']}, {len(log.checksums)} checksums")
+    if divergence is not None:
+        print(f"Diverged from the recording at tick {divergence}")
+        return 1
+    print("Matches the recording")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import threading
+import time
+from snapshot import SnapshotBuffer
+from timestep import FixedTimestep
+
+class SimulationThread:
+    # Runs the fixed-step simulation on a thread of its own and publishes a
+    # snapshot after every tick, so a slow frame no longer holds back ticks
+    # and a slow tick no longer holds back frames. The render thread only
+    # reads snapshots; it must pause() the simulation before touching the
+    # game itself (reset, menus).
+    def __init__(self, game, recorder=None, step=1 / 60, max_substeps=5):
+        self.game = game
+        self.recorder = recorder
+        self.timestep = FixedTimestep(step, max_substeps)
+        self.snapshots = SnapshotBuffer(game)
+        self.running = threading.Event()
+        self.tick_lock = threading.Lock()  # Held while ticks run
+        self.stopping = False
+        self.thread = None
+
+    def start(self):
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+        self.resume()
+
+    def pause(self):
+        # Returns once no tick is running
+        self.running.clear()
+        with self.tick_lock:
+            pass
+
+    def resume(self):
+        self.snapshots.publish(self.game)
+        self.running.set()
+
+    def stop(self):
+        self.stopping = True
+        self.running.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def alpha(self, snapshot):
+        # How far past its snapshot's tick a frame drawn now lies
+        elapsed = (time.perf_counter_ns() - snapshot.published_ns) / 1e9
+        return min(elapsed / self.timestep.step, 1.0)
+
+    def run(self):
+        game = self.game
+        recorder = self.recorder
+        timestep = self.timestep
+        clock = time.perf_counter
+        last = clock()
+        while not self.stopping:
+            if not self.running.is_set():
+                self.running.wait()
+                last = clock()  # Time spent paused is not simulation time
+                continue
+            now = clock()
+            ticks = timestep.advance(now - last)
+            last = now
+            with self.tick_lock:
+                for _ in range(ticks):
+                    if not self.running.is_set():
+                        break
+                    if recorder is not None:
+                        recorder.sample()
+                    game.handle_input()
+                    game.update_game_state()
+                    if recorder is not None:
+                        recorder.end_tick(game)
+                    self.snapshots.publish(game)
+                    if not game.player.alive:
+                        self.running.clear()
+            # Sleep off the rest of the tick instead of spinning on the GIL
+            time.sleep((1.0 - timestep.alpha) * timestep.step)
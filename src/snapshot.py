@@ -0,0 +1,76 @@
+import threading
+import time
+from player import Player
+from enemy import Enemy
+from bullet import BulletStore
+from particle import ParticleSystem
+from mechanics import GrazingSystem
+
+class Snapshot:
+    # Everything a frame draws, copied out of the game at the end of a tick.
+    # It has the attribute names Game's draw path reads, so a frame can be
+    # drawn from it instead of the live game. Arrays and enemy views are
+    # refilled in place each time, a snapshot allocates only when it grows.
+    def __init__(self, game):
+        width, height = game.screen_width, game.screen_height
+        self.tick = 0
+        self.published_ns = 0
+        self.input_sampled_ns = 0  # When the input of the snapshot's tick was read
+        self.score = 0
+        self.wave = 0
+        self.player = Player(width // 2, height // 2, width, height)
+        self.bullets = BulletStore(width, height, friendly=True, capacity=game.bullets.capacity)
+        self.enemy_bullets = BulletStore(width, height, capacity=game.enemy_bullets.capacity)
+        self.enemies = []
+        self.enemy_views = []
+        self.powerups = []
+        self.particles = ParticleSystem(game.particles.capacity)
+        self.graze_system = GrazingSystem()
+
+    def copy_from(self, game):
+        self.tick = game.tick
+        self.input_sampled_ns = game.input.sampled_ns
+        self.score = game.score
+        self.wave = game.wave
+        self.player.copy_from(game.player)
+        self.bullets.copy_from(game.bullets)
+        self.enemy_bullets.copy_from(game.enemy_bullets)
+        views = self.enemy_views
+        while len(views) < len(game.enemies):
+            views.append(Enemy.__new__(Enemy))
+        for view, enemy in zip(views, game.enemies):
+            view.copy_from(enemy)
+        self.enemies = views[:len(game.enemies)]
+        # Power-ups do not move; only drawing touches them, through pulsate_timer
+        self.powerups = list(game.powerups)
+        self.particles.copy_from(game.particles)
+        self.graze_system.copy_from(game.graze_system)
+        self.published_ns = time.perf_counter_ns()
+
+class SnapshotBuffer:
+    # Triple buffer between the simulation and render threads. The simulation
+    # fills `back` and swaps it with `ready`; the renderer swaps `ready` into
+    # `front` when a newer one is waiting. The lock only covers the swaps, so
+    # neither side ever waits for the other to copy or draw.
+    def __init__(self, game):
+        self.back, self.ready, self.front = (Snapshot(game) for _ in range(3))
+        self.lock = threading.Lock()
+        self.fresh = False
+        self.published = 0
+        self.dropped = 0  # Published but replaced before a frame drew them
+
+    def publish(self, game):
+        self.back.copy_from(game)
+        with self.lock:
+            self.back, self.ready = self.ready, self.back
+            if self.fresh:
+                self.dropped += 1
+            self.fresh = True
+            self.published += 1
+
+    def latest(self):
+        with self.lock:
+            if self.fresh:
+                self.front, self.ready = self.ready, self.front
+                self.fresh = False
+        return self.front
@@ -0,0 +1,155 @@
+import math
+import numpy as np
+
+class SpatialHash:
+    # Uniform grid broad-phase over the arena. Items are bucketed by cell with
+    # a stable sort each rebuild, so every cell is a contiguous slice of
+    # self.order and a query only visits the cells within reach of its point.
+    def __init__(self, width, height, cell_size):
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.cell_start = np.zeros(self.cols * self.rows + 1, dtype=np.int64)
+        self.cell_dtype = np.int16 if self.cols * self.rows <= np.iinfo(np.int16).max else np.int64
+        self.order = np.zeros(0, dtype=np.int64)
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.radius = np.zeros(0)
+        self.max_radius = 0.0
+        self._ring_cache = {}
+
+    @classmethod
+    def for_arena(cls, width, height, largest_size, max_cells_per_axis=128):
+        # Cells must be at least as wide as the largest overlap distance so the
+        # 3x3 neighbourhood is enough, but never so small the grid explodes.
+        cell_size = max(2 * largest_size, math.ceil(max(width, height) / max_cells_per_axis))
+        return cls(width, height, cell_size)
+
+    def __len__(self):
+        return len(self.order)
+
+    def cell_coords(self, xs, ys):
+        cols = (np.asarray(xs) // self.cell_size).astype(np.int64)
+        rows = (np.asarray(ys) // self.cell_size).astype(np.int64)
+        # Entities sitting on or past the arena edge belong to the border cells
+        np.maximum(np.minimum(cols, self.cols - 1, out=cols), 0, out=cols)
+        np.maximum(np.minimum(rows, self.rows - 1, out=rows), 0, out=rows)
+        return cols, rows
+
+    def rebuild(self, xs, ys, radii):
+        self.x = np.array(xs, dtype=np.float64)
+        self.y = np.array(ys, dtype=np.float64)
+        self.radius = np.broadcast_to(np.asarray(radii, dtype=np.float64), self.x.shape)
+        self.max_radius = float(self.radius.max()) if len(self.x) else 0.0
+        cols, rows = self.cell_coords(self.x, self.y)
+        cells = rows * self.cols + cols
+        # A stable sort keeps items in insertion order inside each cell
+        # (and sorting 16-bit keys lets NumPy use its linear-time radix sort)
+        self.order = np.argsort(cells.astype(self.cell_dtype), kind="stable")
+        counts = np.bincount(cells, minlength=self.cols * self.rows)
+        np.cumsum(counts, out=self.cell_start[1:])
+
+    def candidates(self, qx, qy, reach):
+        # Broad-phase: every (query, item) pair whose cells are within reach
+        qx = np.atleast_1d(np.asarray(qx, dtype=np.float64))
+        qy = np.atleast_1d(np.asarray(qy, dtype=np.float64))
+        empty = np.zeros(0, dtype=np.int64)
+        if len(self.order) == 0 or len(qx) == 0:
+            return empty, empty
+
+        span = max(1, math.ceil(reach / self.cell_size))
+        offsets = np.arange(-span, span + 1)
+        query_cols, query_rows = self.cell_coords(qx, qy)
+        # One entry per (query, neighbouring cell) in query-major order
+        rows = np.repeat(query_rows[:, None] + offsets, len(offsets), axis=1).ravel()
+        cols = np.tile(query_cols[:, None] + offsets, len(offsets)).ravel()
+        queries = np.repeat(np.arange(len(qx)), len(offsets) * len(offsets))
+        return self.items_in_cells(queries, rows, cols)
+
+    def items_in_cells(self, queries, rows, cols):
+        # Expand each (query, cell) entry into one (query, item) pair per item
+        empty = np.zeros(0, dtype=np.int64)
+        valid = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        cells = rows[valid] * self.cols + cols[valid]
+        starts = self.cell_start[cells]
+        counts = self.cell_start[cells + 1] - starts
+        queries = queries[valid]
+        total = int(counts.sum())
+        if total == 0:
+            return empty, empty
+
+        run_offsets = np.cumsum(counts) - counts
+        slots = np.repeat(starts - run_offsets, counts) + np.arange(total)
+        return np.repeat(queries, counts), self.order[slots]
+
+    def ring_offsets(self, ring):
+        # Cell offsets at exactly Chebyshev distance `ring` from the centre
+        if ring not in self._ring_cache:
+            span = np.arange(-ring, ring + 1)
+            rows, cols = np.meshgrid(span, span, indexing="ij")
+            on_ring = np.maximum(np.abs(rows), np.abs(cols)) == ring
+            self._ring_cache[ring] = (rows[on_ring], cols[on_ring])
+        return self._ring_cache[ring]
+
+    def nearest(self, qx, qy):
+        # Batched nearest-item search: walk outward one ring of cells at a
+        # time and retire a query once nothing in the next ring can be closer.
+        qx = np.atleast_1d(np.asarray(qx, dtype=np.float64))
+        qy = np.atleast_1d(np.asarray(qy, dtype=np.float64))
+        best = np.full(len(qx), -1, dtype=np.int64)
+        best_d2 = np.full(len(qx), np.inf)
+        if len(self.order) == 0:
+            return best
+
+        query_cols, query_rows = self.cell_coords(qx, qy)
+        pending = np.arange(len(qx))
+        for ring in range(max(self.cols, self.rows)):
+            ring_rows, ring_cols = self.ring_offsets(ring)
+            rows = (query_rows[pending][:, None] + ring_rows).ravel()
+            cols = (query_cols[pending][:, None] + ring_cols).ravel()
+            queries = np.repeat(pending, len(ring_rows))
+            queries, items = self.items_in_cells(queries, rows, cols)
+            if len(items):
+                dx = self.x[items] - qx[queries]
+                dy = self.y[items] - qy[queries]
+                d2 = dx * dx + dy * dy
+                # Closest candidate per query, ties going to the lowest item index
+                order = np.lexsort((items, d2, queries))
+                queries = queries[order]
+                first = np.ones(len(queries), dtype=bool)
+                first[1:] = queries[1:] != queries[:-1]
+                queries = queries[first]
+                items = items[order][first]
+                d2 = d2[order][first]
+                # An equally close item from an outer ring still wins on index
+                closer = (d2 < best_d2[queries]) | ((d2 == best_d2[queries]) & (items < best[queries]))
+                best[queries[closer]] = items[closer]
+                best_d2[queries[closer]] = d2[closer]
+
+            # Everything beyond this ring is at least ring * cell_size away,
+            # and may still tie with the best so far
+            reach = ring * self.cell_size
+            pending = pending[best_d2[pending] >= reach * reach]
+            if len(pending) == 0:
+                break
+        return best
+
+    def query(self, qx, qy, query_radius):
+        # Broad-phase followed by the exact circle test, sorted by query then item
+        qx = np.atleast_1d(np.asarray(qx, dtype=np.float64))
+        qy = np.atleast_1d(np.asarray(qy, dtype=np.float64))
+        query_radius = np.broadcast_to(np.asarray(query_radius, dtype=np.float64), qx.shape)
+        reach = (float(query_radius.max()) if len(qx) else 0.0) + self.max_radius
+        queries, items = self.candidates(qx, qy, reach)
+        if len(items) == 0:
+            return queries, items
+        dx = self.x[items] - qx[queries]
+        dy = self.y[items] - qy[queries]
+        limit = self.radius[items] + query_radius[queries]
+        hit = dx * dx + dy * dy < limit * limit
+        queries = queries[hit]
+        items = items[hit]
+        order = np.lexsort((items, queries))
+        return queries[order], items[order]
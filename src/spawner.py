@@ -0,0 +1,79 @@
+import math
+from enemy import Enemy
+
+class WaveSpawner:
+    # Spreads a wave's spawn cost over many ticks. While a wave is played,
+    # the next one's table (type and spawn point of every enemy) is rolled a
+    # few rows per tick; once it starts, its enemies come out over at most
+    # spawn_ticks ticks and never more than spawn_budget in one tick. Types
+    # are rolled with the graze level and difficulty of the tick that rolls
+    # them. Everything is counted in ticks, not wall time, so a replay
+    # spawns exactly what the recording did.
+    def __init__(self, game, spawn_ticks=30, spawn_budget=8, prepare_budget=4):
+        self.game = game
+        self.spawn_ticks = spawn_ticks
+        self.spawn_budget = spawn_budget
+        self.prepare_budget = prepare_budget  # Table rows rolled per tick ahead of the wave
+        self.reset()
+
+    def reset(self):
+        self.table = []  # (type, x, y) of the next wave, as far as it is rolled
+        self.table_wave = 0
+        self.queue = []  # Rows of the current wave still to spawn
+        self.per_tick = 0
+        self.rolled_late = 0  # Rows a wave start had to roll itself, the wave before was too short
+
+    @staticmethod
+    def wave_size(wave):
+        return wave * 2
+
+    @property
+    def pending(self):
+        return len(self.queue)
+
+    def roll(self, count):
+        game = self.game
+        rng = game.rng.spawn
+        level = game.graze_system.level
+        for _ in range(count):
+            enemy_type = game.enemy_behavior.get_enemy_type(level, rng)
+            x, y = Enemy.get_spawn_position(game.screen_width, game.screen_height, rng)
+            self.table.append((enemy_type, x, y))
+
+    def prepare(self, wave):
+        if self.table_wave != wave:
+            self.table = []
+            self.table_wave = wave
+        missing = self.wave_size(wave) - len(self.table)
+        if missing > 0:
+            self.roll(min(missing, self.prepare_budget))
+
+    def start(self, wave):
+        # Takes the rolled table as the queue, rolling whatever it still lacks
+        if self.table_wave != wave:
+            self.table = []
+            self.table_wave = wave
+        missing = self.wave_size(wave) - len(self.table)
+        if missing > 0:
+            self.rolled_late += missing
+            self.roll(missing)
+        self.queue = self.table
+        self.queue.reverse()  # Spawned by popping from the end, in rolled order
+        self.table = []
+        self.per_tick = min(self.spawn_budget, max(1, math.ceil(len(self.queue) / self.spawn_ticks)))
+
+    def release(self, count):
+        game = self.game
+        queue = self.queue
+        for _ in range(min(count, len(queue))):
+            enemy_type, x, y = queue.pop()
+            game.enemies.append(game.enemy_pool.acquire(enemy_type, game.screen_width, game.screen_height,
+                                                        game.rng.spawn, (x, y)))
+
+    def update(self, wave):
+        # Once a tick: spawn this tick's share of the current wave, or roll
+        # the next one ahead while there is nothing to spawn
+        if self.queue:
+            self.release(self.per_tick)
+        else:
+            self.prepare(wave + 1)
@@ -0,0 +1,160 @@
+# Balance sweeps: every combination of a parameter grid played by many
+# seeded headless games, spread over all cores, with one row per game in a
+# columnar results file.
+#
+#   python src/sweep.py --param fire_rate=40,60,80 --param powerup_duration=300,600 \
+#       --seeds 500 --out sweep.npz
+import argparse
+import csv
+import itertools
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from headless import DEFAULT_SCREEN_SIZE, create_game, create_input, run
+
+# Short names for the knobs worth tuning; any other attribute of the game
+# can be swept by its dotted path, e.g. enemy_behavior.boss_bullet_budget
+PARAMETER_ALIASES = {
+    "difficulty": "enemy_behavior.base_difficulty",
+    "difficulty_step": "enemy_behavior.difficulty_step",
+    "max_difficulty": "enemy_behavior.max_difficulty",
+    "fire_rate": "enemy_behavior.base_enemy_fire_rate",
+    "powerup_duration": "powerup_system.powerup_duration",
+    "graze_meter": "graze_system.max_meter",
+    "graze_outer": "graze_system.outer_graze_distance",
+    "graze_inner": "graze_system.inner_graze_distance",
+    "spawn_ticks": "spawner.spawn_ticks",
+    "spawn_budget": "spawner.spawn_budget",
+}
+METRICS = ("wave", "score", "ticks", "alive", "peak_entities", "mean_tick_ms")
+
+def parse_param(text):
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=V1,V2,... got {text!r}")
+    return name, [float(value) for value in values.split(",")]
+
+def expand_grid(params):
+    names = [name for name, _ in params]
+    return names, list(itertools.product(*(values for _, values in params)))
+
+def apply_params(game, names, values):
+    # Set after reset(), which rebuilds some of these systems
+    for name, value in zip(names, values):
+        *owners, attr = PARAMETER_ALIASES.get(name, name).split(".")
+        target = game
+        for owner in owners:
+            target = getattr(target, owner)
+        current = getattr(target, attr)
+        setattr(target, attr, type(current)(value))
+
+def run_chunk(jobs, names, grid, policy, max_ticks, screen_size):
+    # One chunk per task keeps pickling and scheduling off the per-game path;
+    # results come back as columns, not a dict per game
+    columns = {name: np.zeros(len(jobs)) for name in METRICS}
+    for row, (config, seed) in enumerate(jobs):
+        source = create_input(policy, seed)
+        game = create_game(source, screen_size, seed=seed)
+        apply_params(game, names, grid[config])
+        stats = run(game, source, max_ticks)
+        columns["wave"][row] = stats["wave"]
+        columns["score"][row] = stats["score"]
+        columns["ticks"][row] = stats["ticks"]
+        columns["alive"][row] = stats["alive"]
+        columns["peak_entities"][row] = stats["peak_entities"]
+        columns["mean_tick_ms"][row] = stats["seconds"] * 1000 / max(stats["ticks"], 1)
+    return columns
+
+def sweep(names, grid, seeds, policy="random", max_ticks=18000, screen_size=DEFAULT_SCREEN_SIZE,
+          workers=None, chunk_size=None, progress=None):
+    jobs = [(config, seed) for config in range(len(grid)) for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker so a slow chunk at the end does not leave cores idle
+        chunk_size = max(1, math.ceil(len(jobs) / (workers * 4)))
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+    parts = [None] * len(chunks)
+    done = 0
+    if workers == 1:
+        for i, chunk in enumerate(chunks):
+            parts[i] = run_chunk(chunk, names, grid, policy, max_ticks, screen_size)
+            done += len(chunk)
+            if progress is not None:
+                progress(done, len(jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_chunk, chunk, names, grid, policy, max_ticks, screen_size): i
+                       for i, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                i = futures[future]
+                parts[i] = future.result()
+                done += len(chunks[i])
+                if progress is not None:
+                    progress(done, len(jobs))
+
+    configs = np.array([config for config, _ in jobs], dtype=np.int32)
+    results = {"config": configs, "seed": np.array([seed for _, seed in jobs], dtype=np.int64)}
+    params = np.array(grid, dtype=np.float64).reshape(len(grid), len(names))
+    for column, name in enumerate(names):
+        results[name] = params[configs, column]
+    for name in METRICS:
+        results[name] = np.concatenate([part[name] for part in parts])
+    return results
+
+def write_results(path, results):
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(results)
+            writer.writerows(zip(*(column.tolist() for column in results.values())))
+    else:
+        np.savez_compressed(path, **results)
+
+def summarize(names, grid, results):
+    print(f"{'config':>6} " + " ".join(f"{name:>16}" for name in names)
+          + f" {'games':>6} {'wave':>6} {'score':>8} {'survived':>8} {'tick ms':>8}")
+    for config, values in enumerate(grid):
+        rows = results["config"] == config
+        print(f"{config:>6} " + " ".join(f"{value:>16g}" for value in values)
+              + f" {np.count_nonzero(rows):>6} {results['wave'][rows].mean():>6.2f}"
+              f" {results['score'][rows].mean():>8.0f} {results['alive'][rows].mean():>8.1%}"
+              f" {results['mean_tick_ms'][rows].mean():>8.3f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep balance parameters over seeded headless games")
+    parser.add_argument("--param", type=parse_param, action="append", default=[],
+                        help="NAME=V1,V2,... where NAME is one of %s or a dotted game attribute"
+                             % ", ".join(PARAMETER_ALIASES))
+    parser.add_argument("--seeds", type=int, default=100, help="games per parameter combination")
+    parser.add_argument("--seed-start", type=int, default=0)
+    parser.add_argument("--input", choices=["random", "scripted", "idle"], default="random")
+    parser.add_argument("--ticks", type=int, default=18000, help="maximum ticks per game")
+    parser.add_argument("--size", default="%dx%d" % DEFAULT_SCREEN_SIZE, help="arena size as WIDTHxHEIGHT")
+    parser.add_argument("--workers", type=int, help="processes to use, all cores by default")
+    parser.add_argument("--chunk-size", type=int, help="games per task handed to a worker")
+    parser.add_argument("--out", default="sweep.npz", help="results file, .npz or .csv")
+    args = parser.parse_args(argv)
+
+    names, grid = expand_grid(args.param)
+    screen_size = tuple(int(n) for n in args.size.lower().split("x"))
+    seeds = range(args.seed_start, args.seed_start + args.seeds)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} games", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    results = sweep(names, grid, seeds, args.input, args.ticks, screen_size, args.workers, args.chunk_size, progress)
+    elapsed = time.perf_counter() - start
+    print(file=sys.stderr)
+    write_results(args.out, results)
+    print(f"{len(results['seed'])} games in {elapsed:.1f}s, results in {args.out}")
+    summarize(names, grid, results)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+class FixedTimestep:
+    # Turns variable frame times into a whole number of fixed simulation ticks.
+    # At most max_substeps ticks run per frame; time beyond that is dropped
+    # (the game slows down) instead of being owed to later frames, which would
+    # make every following frame slower still.
+    def __init__(self, step=1 / 60, max_substeps=5):
+        self.step = step
+        self.max_substeps = max_substeps
+        self.accumulated = 0.0
+        self.frames = 0
+        self.ticks = 0
+        self.capped_frames = 0
+        self.dropped_time = 0.0
+
+    def advance(self, frame_time):
+        self.frames += 1
+        self.accumulated += frame_time
+        ticks = int(self.accumulated / self.step)
+        if ticks > self.max_substeps:
+            # Keep the fraction so interpolation stays smooth across the cap
+            dropped = (ticks - self.max_substeps) * self.step
+            self.dropped_time += dropped
+            self.accumulated -= dropped
+            self.capped_frames += 1
+            ticks = self.max_substeps
+        self.accumulated -= ticks * self.step
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self):
+        return min(self.accumulated / self.step, 1.0)
+
+    def report(self):
+        return (f"{self.ticks} ticks over {self.frames} frames, {self.capped_frames} frames hit the "
+                f"{self.max_substeps}-tick cap, {self.dropped_time:.2f}s of simulation time dropped")
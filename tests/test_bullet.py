@@ -0,0 +1,52 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bullet import BulletStore
+
+class StubEnemy:
+    pass
+
+def filled_store(count):
+    # Each row's damage is its spawn index, to follow rows through compaction
+    store = BulletStore(800, 600, capacity=4)
+    for i in range(count):
+        store.spawn(100 + i, 200, 0.0, damage=i, bullet_type="homing")
+    return store
+
+def test_compaction_keeps_live_rows():
+    store = filled_store(8)
+    store.x[:8] += 10 * store.damage[:8]
+    store.kill([1, 3, 4])
+    store.compact()
+    assert store.count == 5
+    live = store.damage[:5].tolist()
+    assert sorted(live) == [0, 2, 5, 6, 7]
+    # Rows still live in the head stay put, the tail fills the holes
+    assert live[0] == 0 and live[2] == 2
+    for row, spawned in enumerate(live):
+        assert store.x[row] == 100 + spawned + 10 * spawned
+        assert store.lifetime[row] == 180
+
+def test_compaction_moves_targets_with_their_rows():
+    store = filled_store(6)
+    enemies = [StubEnemy() for _ in range(6)]
+    for i in (0, 2, 5):
+        store.target[i] = enemies[i]
+    store.kill([1, 2])
+    store.compact()
+    assert store.count == 4
+    for row in range(store.count):
+        spawned = store.damage[row]
+        expected = enemies[spawned] if spawned in (0, 5) else None
+        assert store.target[row] is expected
+    # Dead rows hold no references to enemies
+    assert all(target is None for target in store.target[store.count:6])
+
+def test_compaction_drops_bullets_leaving_the_arena():
+    store = filled_store(3)
+    store.x[1] = -5
+    store.compact()
+    assert sorted(store.damage[:store.count].tolist()) == [0, 2]
@@ -0,0 +1,41 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from mechanics import GrazingSystem
+from proximity import PlayerProximity, ZONE_INNER
+
+class StubPlayer:
+    x = 0.0
+    y = 0.0
+
+def inner_grazes(count):
+    proximity = PlayerProximity()
+    proximity.bullet_count = count
+    proximity.dx = np.linspace(10, 20, count)
+    proximity.dy = np.zeros(count)
+    proximity.hit = np.zeros(count, dtype=bool)
+    proximity.zone = np.full(count, ZONE_INNER, dtype=np.int8)
+    return proximity
+
+def test_meter_gain_carries_over():
+    graze = GrazingSystem()
+    graze.meter = 90
+    assert graze.add_meter(25) == 1
+    assert graze.level == 1
+    assert graze.meter == 15
+
+def test_dense_grazing_levels_up_more_than_once_a_tick():
+    graze = GrazingSystem()
+    # 120 inner grazes at 2 each is 240 meter, two full levels and 40 over
+    assert graze.update(StubPlayer(), inner_grazes(120)) == 2
+    assert graze.level == 2
+    assert graze.meter == 40
+
+def test_no_grazes_no_levels():
+    graze = GrazingSystem()
+    assert graze.update(StubPlayer(), inner_grazes(0)) == 0
+    assert graze.meter == 0
@@ -0,0 +1,30 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+from effects import EffectCache
+from powerup import PowerUp
+from renderer import SpriteBatchRenderer
+
+def test_every_powerup_pulses():
+    pygame.font.init()
+    screen = pygame.Surface((200, 200))
+    renderer = SpriteBatchRenderer(EffectCache())
+    # sin(0.1 * 31) * 3 truncates to 0, the offset that used to switch pulsing off
+    powerups = [PowerUp(50, 50, "spread"), PowerUp(100, 100, "laser"), PowerUp(150, 150, "bomb")]
+    powerups[0].pulsate_timer = 3.0
+    for _ in range(3):
+        renderer.draw_powerups(screen, powerups, pulse=True)
+    assert powerups[0].pulsate_timer > 3.0
+    assert all(powerup.pulsate_timer > 0 for powerup in powerups[1:])
+
+def test_no_pulse_leaves_timers_alone():
+    pygame.font.init()
+    screen = pygame.Surface((200, 200))
+    renderer = SpriteBatchRenderer(EffectCache())
+    powerups = [PowerUp(50, 50, "spread"), PowerUp(100, 100, "laser")]
+    renderer.draw_powerups(screen, powerups, pulse=False)
+    assert [powerup.pulsate_timer for powerup in powerups] == [0, 0]
@@ -0,0 +1,70 @@
+import math
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from headless import create_game
+from replay import CHECKSUM_INTERVAL, InputLog, InputRecorder, replay
+
+SCREEN_SIZE = (640, 480)
+TICKS = CHECKSUM_INTERVAL * 4
+
+class CirclingStick:
+    # Walks in a circle, aiming the other way with the trigger held
+    def __init__(self):
+        self.tick = 0
+
+    def init(self):
+        pass
+
+    def get_numaxes(self):
+        return 6
+
+    def get_numbuttons(self):
+        return 11
+
+    def get_axis(self, axis):
+        angle = self.tick / 20
+        return (math.cos(angle), math.sin(angle), -math.cos(angle), -math.sin(angle), 0.0, 1.0)[axis]
+
+    def get_button(self, button):
+        return 0
+
+def record(path, seed=3):
+    stick = CirclingStick()
+    recorder = InputRecorder(stick)
+    game = create_game(recorder, SCREEN_SIZE, seed=seed)
+    recorder.start(path, seed, SCREEN_SIZE)
+    for tick in range(TICKS):
+        stick.tick = tick
+        recorder.sample()
+        game.handle_input()
+        game.update_game_state()
+        recorder.end_tick(game)
+    recorder.close()
+    return InputLog.read(path)
+
+def test_replay_matches_recording(tmp_path):
+    log = record(str(tmp_path / "run.inputlog"))
+    assert len(log.frames) == TICKS
+    assert sorted(log.checksums) == [CHECKSUM_INTERVAL * n for n in range(1, 5)]
+    stats, divergence = replay(log)
+    assert stats["ticks"] == TICKS
+    assert divergence is None
+
+def test_replay_reports_tampered_input(tmp_path):
+    log = record(str(tmp_path / "run.inputlog"))
+    # Stand still for one tick, early on while the player is still alive
+    axes, buttons = log.frames[10]
+    log.frames[10] = ([0.0, 0.0] + axes[2:], buttons)
+    _, divergence = replay(log)
+    assert divergence == CHECKSUM_INTERVAL
+
+def test_replay_reports_first_bad_checksum(tmp_path):
+    log = record(str(tmp_path / "run.inputlog"))
+    log.checksums[CHECKSUM_INTERVAL * 3] ^= 1
+    log.checksums[CHECKSUM_INTERVAL * 4] ^= 1
+    _, divergence = replay(log)
+    assert divergence == CHECKSUM_INTERVAL * 3
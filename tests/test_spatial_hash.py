@@ -0,0 +1,63 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from spatial_hash import SpatialHash
+
+def scattered(count, seed, width=640, height=480):
+    rng = np.random.default_rng(seed)
+    # A few points past the edges land in the border cells
+    return rng.uniform(-20, width + 20, count), rng.uniform(-20, height + 20, count)
+
+def brute_force_pairs(qx, qy, query_radius, xs, ys, radii):
+    pairs = []
+    for q in range(len(qx)):
+        for i in range(len(xs)):
+            limit = query_radius + radii[i]
+            if (xs[i] - qx[q]) ** 2 + (ys[i] - qy[q]) ** 2 < limit * limit:
+                pairs.append((q, i))
+    return pairs
+
+def test_query_matches_brute_force_in_order():
+    xs, ys = scattered(300, 1)
+    radii = np.random.default_rng(2).uniform(2, 12, len(xs))
+    qx, qy = scattered(40, 3)
+    grid = SpatialHash.for_arena(640, 480, 12)
+    grid.rebuild(xs, ys, radii)
+    queries, items = grid.query(qx, qy, 15)
+    # Sorted by query then item, exactly the pairs a full scan finds
+    assert list(zip(queries.tolist(), items.tolist())) == brute_force_pairs(qx, qy, 15, xs, ys, radii)
+
+def test_query_reaching_past_one_cell():
+    xs, ys = scattered(200, 4)
+    qx, qy = scattered(10, 5)
+    grid = SpatialHash(640, 480, 16)
+    grid.rebuild(xs, ys, 3)
+    queries, items = grid.query(qx, qy, 70)
+    assert list(zip(queries.tolist(), items.tolist())) == brute_force_pairs(qx, qy, 70, xs, ys, [3] * len(xs))
+
+def test_nearest_matches_linear_scan():
+    xs, ys = scattered(150, 6)
+    qx, qy = scattered(60, 7)
+    grid = SpatialHash.for_arena(640, 480, 10)
+    grid.rebuild(xs, ys, 10)
+    best = grid.nearest(qx, qy)
+    for q in range(len(qx)):
+        d2 = (xs - qx[q]) ** 2 + (ys - qy[q]) ** 2
+        assert d2[best[q]] == d2.min()
+
+def test_nearest_with_sparse_items_and_ties():
+    grid = SpatialHash(640, 480, 20)
+    # Far from the queries, so the search walks many empty rings; items 1
+    # and 2 are equally close to the query and the lower index wins
+    grid.rebuild([600.0, 10.0, 30.0], [460.0, 20.0, 20.0], 1)
+    assert grid.nearest([20.0, 590.0], [20.0, 470.0]).tolist() == [1, 0]
+
+def test_empty_grid():
+    grid = SpatialHash(640, 480, 20)
+    grid.rebuild([], [], 1)
+    queries, items = grid.query([10.0], [10.0], 5)
+    assert len(queries) == len(items) == 0
+    assert grid.nearest([10.0], [10.0]).tolist() == [-1]